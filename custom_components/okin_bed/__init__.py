@@ -6,7 +6,6 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
 from .const import (
-    DOMAIN,
     CONF_MAC_ADDRESS,
     CONF_DEVICE_NAME,
     CONF_CONNECTION_MODE,
@@ -31,7 +30,6 @@ PLATFORMS: list[Platform] = [
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up OKIN Bed from a config entry."""
     _LOGGER.info("Setting up OKIN Bed integration for %s", entry.data.get(CONF_DEVICE_NAME))
-    hass.data.setdefault(DOMAIN, {})
 
     # Get connection mode and API URL (if set)
     connection_mode = entry.data.get(CONF_CONNECTION_MODE, MODE_DIRECT)
@@ -46,8 +44,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         api_url,
     )
 
-    # Store coordinator
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    # One-time health probe for remote mode; later reconnects skip it
+    if not await coordinator.async_probe_api():
+        _LOGGER.warning(
+            "Remote API %s not reachable yet; commands will retry on use", api_url
+        )
+
+    # Store coordinator directly on the entry (no hass.data indirection)
+    entry.runtime_data = coordinator
 
     # Set up all platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -59,9 +63,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         # Disconnect from bed and cleanup
-        coordinator: OkinBedCoordinator = hass.data[DOMAIN][entry.entry_id]
+        coordinator: OkinBedCoordinator = entry.runtime_data
         await coordinator.async_disconnect()
 
-        hass.data[DOMAIN].pop(entry.entry_id)
-
     return unload_ok
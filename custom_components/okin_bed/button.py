@@ -8,7 +8,6 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
-    DOMAIN,
     CONF_DEVICE_NAME,
     PRESETS,
     PRESET_FLAT,
@@ -21,6 +20,15 @@ from .coordinator import OkinBedCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Map preset IDs to OkinBed method names
+_COMMAND_MAP = {
+    PRESET_FLAT: "flat",
+    PRESET_ZERO_GRAVITY: "zero_gravity",
+    PRESET_ANTI_SNORE: "anti_snore",
+    PRESET_TV: "tv_position",
+    PRESET_LOUNGE: "lounge",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -28,7 +36,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up OKIN Bed button entities."""
-    coordinator: OkinBedCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: OkinBedCoordinator = config_entry.runtime_data
     device_name = config_entry.data[CONF_DEVICE_NAME]
 
     entities = [
@@ -58,21 +66,13 @@ class OkinBedPresetButton(ButtonEntity):
         self._attr_name = f"{device_name} {preset_name}"
         self._attr_unique_id = f"{coordinator.mac_address}_preset_{preset_id}"
 
+        # Resolve the OkinBed method name once instead of on every press
+        self._command_name = _COMMAND_MAP.get(preset_id)
+        if self._command_name is None:
+            _LOGGER.error("Unknown preset: %s", preset_id)
+
     async def async_press(self) -> None:
         """Handle the button press."""
         _LOGGER.info("Activating preset: %s", self._preset_id)
-
-        # Map preset IDs to OkinBed method names
-        command_map = {
-            PRESET_FLAT: "flat",
-            PRESET_ZERO_GRAVITY: "zero_gravity",
-            PRESET_ANTI_SNORE: "anti_snore",
-            PRESET_TV: "tv_position",
-            PRESET_LOUNGE: "lounge",
-        }
-
-        command_name = command_map.get(self._preset_id)
-        if command_name:
-            await self.coordinator.async_send_command(command_name)
-        else:
-            _LOGGER.error("Unknown preset: %s", self._preset_id)
+        if self._command_name:
+            await self.coordinator.async_send_command(self._command_name)
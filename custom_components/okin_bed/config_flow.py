@@ -1,6 +1,7 @@
 """Config flow for OKIN Adjustable Bed integration."""
 
 import logging
+import re
 from typing import Any
 
 import voluptuous as vol
@@ -29,15 +30,31 @@ _LOGGER = logging.getLogger(__name__)
 # Debug logging to verify this version is loaded
 _LOGGER.warning("OKIN Bed config_flow.py loading - Version 2.0.7 - Manual entry support")
 
+# Precompiled name matcher - advertisements arrive constantly, so avoid
+# re-lowercasing every pattern for every discovered device
+_NAME_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in DEVICE_NAME_PATTERNS),
+    re.IGNORECASE,
+)
+
+# MAC address validation (compiled once, not per form submission)
+_MAC_RE = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}[0-9A-Fa-f]{2}$")
+
+
+def _filter_okin_devices(discovered) -> dict[str, BluetoothServiceInfoBleak]:
+    """Filter discovered service info down to devices matching OKIN patterns."""
+    return {
+        device.address: device
+        for device in discovered
+        if _NAME_RE.search(device.name or "")
+    }
+
 
 async def _async_has_devices(hass: HomeAssistant) -> bool:
     """Return if there are devices that can be discovered."""
     # Check for any Bluetooth devices matching OKIN patterns
     discovered = async_discovered_service_info(hass, connectable=True)
-    return any(
-        any(pattern.lower() in (device.name or "").lower() for pattern in DEVICE_NAME_PATTERNS)
-        for device in discovered
-    )
+    return bool(_filter_okin_devices(discovered))
 
 
 class OkinBedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -48,6 +65,7 @@ class OkinBedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self) -> None:
         """Initialize the config flow."""
         self._discovered_devices: dict[str, BluetoothServiceInfoBleak] = {}
+        self._device_list_cache: dict[str, str] | None = None
         self._selected_device: BluetoothServiceInfoBleak | None = None
         self._manual_mac: str | None = None
         self._connection_mode: str | None = None
@@ -66,14 +84,8 @@ class OkinBedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         # Check if any devices discovered
         discovered = async_discovered_service_info(self.hass, connectable=True)
-        self._discovered_devices = {
-            device.address: device
-            for device in discovered
-            if any(
-                pattern.lower() in (device.name or "").lower()
-                for pattern in DEVICE_NAME_PATTERNS
-            )
-        }
+        self._discovered_devices = _filter_okin_devices(discovered)
+        self._device_list_cache = None
 
         # Offer both options
         setup_options = {
@@ -111,15 +123,16 @@ class OkinBedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Go to connection mode selection
             return await self.async_step_connection_mode()
 
-        # Create device selection schema
-        device_list = {
-            device.address: f"{device.name or 'Unknown'} ({device.address})"
-            for device in self._discovered_devices.values()
-        }
+        # Create device selection schema (formatted once, reused on re-renders)
+        if self._device_list_cache is None:
+            self._device_list_cache = {
+                device.address: f"{device.name or 'Unknown'} ({device.address})"
+                for device in self._discovered_devices.values()
+            }
 
         data_schema = vol.Schema(
             {
-                vol.Required(CONF_MAC_ADDRESS): vol.In(device_list),
+                vol.Required(CONF_MAC_ADDRESS): vol.In(self._device_list_cache),
             }
         )
 
@@ -168,9 +181,7 @@ class OkinBedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     def _is_valid_mac(self, mac: str) -> bool:
         """Validate MAC address format."""
-        import re
-        pattern = r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$'
-        return bool(re.match(pattern, mac))
+        return _MAC_RE.match(mac) is not None
 
     async def async_step_connection_mode(
         self, user_input: dict[str, Any] | None = None
@@ -300,16 +311,15 @@ class OkinBedConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Handle bluetooth discovery."""
         _LOGGER.debug("Discovered OKIN bed: %s", discovery_info)
 
-        # Check if device name matches OKIN patterns
-        if not any(
-            pattern.lower() in (discovery_info.name or "").lower()
-            for pattern in DEVICE_NAME_PATTERNS
-        ):
-            return self.async_abort(reason="not_supported")
-
+        # Abort already-configured addresses first - rediscovery of a known bed
+        # is the common case and should not pay for the name match
         await self.async_set_unique_id(discovery_info.address)
         self._abort_if_unique_id_configured()
 
+        # Check if device name matches OKIN patterns
+        if not _NAME_RE.search(discovery_info.name or ""):
+            return self.async_abort(reason="not_supported")
+
         self._selected_device = discovery_info
 
         return await self.async_step_name()
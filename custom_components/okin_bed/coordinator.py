@@ -4,6 +4,9 @@ import asyncio
 import logging
 from typing import Any
 
+import aiohttp
+from bleak.exc import BleakError
+
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
@@ -14,10 +17,61 @@ from .const import DOMAIN, CONF_MAC_ADDRESS, MODE_DIRECT, MODE_REMOTE
 
 _LOGGER = logging.getLogger(__name__)
 
+# Errors we expect from BLE and remote-API operations. Anything else is a
+# programming bug and should propagate; CancelledError must never be swallowed
+_TRANSPORT_ERRORS = (BleakError, aiohttp.ClientError, asyncio.TimeoutError, OSError)
+
+# On the send path, OkinBed raises RuntimeError when the link dropped out
+# from under it (bleak's disconnect callback clears its connected flag
+# before we notice). That's a transport failure for our purposes - it must
+# reset _connected so the fast path reconnects instead of failing forever
+_SEND_ERRORS = _TRANSPORT_ERRORS + (RuntimeError,)
+
+# Command name -> remote API endpoint (built once at import, not per dispatch)
+_COMMAND_ENDPOINTS = {
+    # Position controls
+    "head_up": "/head/up",
+    "head_down": "/head/down",
+    "lumbar_up": "/lumbar/up",
+    "lumbar_down": "/lumbar/down",
+    "foot_up": "/foot/up",
+    "foot_down": "/foot/down",
+    "stop": "/stop",
+    # Presets
+    "flat": "/preset/flat",
+    "zero_gravity": "/preset/zero-gravity",
+    "anti_snore": "/preset/anti-snore",
+    "tv_position": "/preset/tv",
+    "lounge": "/preset/lounge",
+    # Massage
+    "massage_on": "/massage/on",
+    "massage_off": "/massage/off",
+    # Lighting
+    "light_on": "/light/on",
+    "light_off": "/light/off",
+    "light_toggle": "/light/toggle",
+}
+
 
 class OkinBedCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the OKIN bed."""
 
+    __slots__ = (
+        "mac_address",
+        "device_name",
+        "connection_mode",
+        "api_url",
+        "bed",
+        "_session",
+        "_url_map",
+        "_connected",
+        "_lock",
+        "_active_movements",
+        "_direct_methods",
+        "_tx_queue",
+        "_tx_worker",
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -35,11 +89,28 @@ class OkinBedCoordinator(DataUpdateCoordinator):
         self.mac_address = mac_address
         self.device_name = device_name
         self.connection_mode = connection_mode
-        self.api_url = api_url
+        self.api_url = api_url.rstrip("/") if api_url else None
         self.bed = None
+        # Shared aiohttp session, resolved once instead of per call
+        self._session = async_get_clientsession(hass) if connection_mode == MODE_REMOTE else None
+        # Fully-formed command URLs; api_url and mac_address never change, so
+        # build them once instead of formatting per send
+        self._url_map: dict[str, str] = {}
+        if connection_mode == MODE_REMOTE and self.api_url:
+            self._url_map = {
+                command: f"{self.api_url}{endpoint}?mac={mac_address}"
+                for command, endpoint in _COMMAND_ENDPOINTS.items()
+            }
         self._connected = False
         self._lock = asyncio.Lock()
-        self._active_movements: dict[str, asyncio.Task] = {}
+        # movement_id -> (task, command_name)
+        self._active_movements: dict[str, tuple[asyncio.Task, str]] = {}
+        # Bound OkinBed methods, resolved at connect time (direct mode only)
+        self._direct_methods: dict[str, Any] = {}
+        # One-shot commands go through a single worker task so writes to the
+        # bed are serialized and entity callbacks return immediately
+        self._tx_queue: asyncio.Queue[str] = asyncio.Queue(maxsize=16)
+        self._tx_worker: asyncio.Task | None = None
 
         # Only create bed instance in direct mode
         if connection_mode == MODE_DIRECT:
@@ -53,30 +124,58 @@ class OkinBedCoordinator(DataUpdateCoordinator):
 
     async def async_connect(self) -> bool:
         """Ensure bed is connected."""
+        # Lock-free fast path - every command send lands here, so skip the
+        # lock entirely once connected
+        if self._connected:
+            return True
+
         async with self._lock:
+            # Re-check under the lock in case another coroutine connected first
             if self._connected:
                 return True
 
             try:
                 if self.connection_mode == MODE_DIRECT:
-                    await self.bed.connect()
+                    # connect() reports failure by returning False, not by
+                    # raising - don't mark connected on a failed attempt
+                    if not await self.bed.connect():
+                        _LOGGER.error("Failed to connect to bed: %s", self.mac_address)
+                        return False
+                    # Resolve command methods once instead of getattr per send
+                    self._direct_methods = {
+                        name: method
+                        for name in _COMMAND_ENDPOINTS
+                        if callable(method := getattr(self.bed, name, None))
+                    }
                     self._connected = True
                     _LOGGER.info("Connected to OKIN bed: %s", self.device_name)
                 elif self.connection_mode == MODE_REMOTE:
-                    # Test API connection
-                    session = async_get_clientsession(self.hass)
-                    async with session.get(f"{self.api_url}/health") as resp:
-                        if resp.status == 200:
-                            self._connected = True
-                            _LOGGER.info("Connected to remote OKIN bed API: %s", self.api_url)
-                        else:
-                            raise Exception(f"API health check failed: {resp.status}")
+                    # No upfront probe - the first real command doubles as the
+                    # connectivity test, saving an HTTP round-trip on every
+                    # reconnect (the probe runs once at entry setup instead)
+                    self._connected = True
+                    _LOGGER.info("Using remote OKIN bed API: %s", self.api_url)
                 return True
-            except Exception as err:
+            except _TRANSPORT_ERRORS as err:
                 _LOGGER.error("Failed to connect to bed: %s", err)
                 self._connected = False
                 return False
 
+    async def async_probe_api(self) -> bool:
+        """Check the remote API health endpoint once (used at entry setup)."""
+        if self.connection_mode != MODE_REMOTE:
+            return True
+
+        try:
+            async with self._session.get(f"{self.api_url}/health") as resp:
+                if resp.status == 200:
+                    return True
+                _LOGGER.error("API health check failed: %s", resp.status)
+                return False
+        except _TRANSPORT_ERRORS as err:
+            _LOGGER.error("API health check failed: %s", err)
+            return False
+
     async def async_disconnect(self) -> None:
         """Disconnect from bed."""
         async with self._lock:
@@ -84,8 +183,13 @@ class OkinBedCoordinator(DataUpdateCoordinator):
                 return
 
             try:
+                # Stop the command worker
+                if self._tx_worker and not self._tx_worker.done():
+                    self._tx_worker.cancel()
+                self._tx_worker = None
+
                 # Cancel any active movements
-                for task in self._active_movements.values():
+                for task, _command in self._active_movements.values():
                     if not task.done():
                         task.cancel()
                 self._active_movements.clear()
@@ -93,21 +197,58 @@ class OkinBedCoordinator(DataUpdateCoordinator):
                 if self.connection_mode == MODE_DIRECT and self.bed:
                     await self.bed.disconnect()
 
+                # Drop bound-method refs so they don't outlive the connection
+                self._direct_methods.clear()
                 self._connected = False
                 _LOGGER.info("Disconnected from OKIN bed: %s", self.device_name)
-            except Exception as err:
+            except _TRANSPORT_ERRORS as err:
                 _LOGGER.error("Error disconnecting from bed: %s", err)
 
     async def async_send_command(self, command_name: str) -> bool:
-        """Send a single command to the bed."""
-        if not await self.async_connect():
-            return False
+        """Queue a single command for the bed.
+
+        Commands are drained by one worker task, which serializes writes (the
+        bed cannot handle concurrent BLE writes) and keeps entity callbacks
+        from blocking on the radio. Returns True if the command was queued.
+        """
+        if self._tx_worker is None or self._tx_worker.done():
+            self._tx_worker = self.hass.async_create_task(self._async_tx_worker())
 
+        try:
+            self._tx_queue.put_nowait(command_name)
+        except asyncio.QueueFull:
+            # Drop the oldest queued command rather than stalling the caller
+            dropped = self._tx_queue.get_nowait()
+            _LOGGER.warning("Command queue full, dropping: %s", dropped)
+            self._tx_queue.put_nowait(command_name)
+        return True
+
+    async def _async_tx_worker(self) -> None:
+        """Drain queued commands one at a time."""
+        while True:
+            command_name = await self._tx_queue.get()
+            try:
+                if await self.async_connect():
+                    await self._async_send_command_fast(command_name)
+            except Exception:  # noqa: BLE001 - worker must survive any send
+                _LOGGER.exception("Unexpected error sending command %s", command_name)
+            finally:
+                self._tx_queue.task_done()
+
+    async def _async_send_command_fast(self, command_name: str) -> bool:
+        """Send a command assuming the connection is already established.
+
+        Used by the continuous-movement loop, which connects once up front
+        instead of re-verifying on every tick.
+        """
         try:
             if self.connection_mode == MODE_DIRECT:
-                # Get the method from the OkinBed class
-                command_method = getattr(self.bed, command_name, None)
-                if command_method is None:
+                # Look up the method bound at connect time; unknown commands
+                # only happen on programming bugs, so EAFP keeps the hot path
+                # to a single dict probe
+                try:
+                    command_method = self._direct_methods[command_name]
+                except KeyError:
                     _LOGGER.error("Unknown command: %s", command_name)
                     return False
 
@@ -116,16 +257,14 @@ class OkinBedCoordinator(DataUpdateCoordinator):
                 return True
 
             elif self.connection_mode == MODE_REMOTE:
-                # Map command name to API endpoint
-                endpoint = self._map_command_to_endpoint(command_name)
-                if not endpoint:
+                # Look up the pre-built command URL (EAFP, same as above)
+                try:
+                    url = self._url_map[command_name]
+                except KeyError:
                     _LOGGER.error("Unknown command for remote mode: %s", command_name)
                     return False
 
-                # Send HTTP POST request with MAC address query parameter
-                session = async_get_clientsession(self.hass)
-                url = f"{self.api_url}{endpoint}?mac={self.mac_address}"
-                async with session.post(url) as resp:
+                async with self._session.post(url) as resp:
                     if resp.status == 200:
                         _LOGGER.debug("Sent remote command: %s to %s", command_name, self.mac_address)
                         return True
@@ -133,53 +272,15 @@ class OkinBedCoordinator(DataUpdateCoordinator):
                         _LOGGER.error("Remote command failed: %s (status %s)", command_name, resp.status)
                         return False
 
-        except Exception as err:
+        except _SEND_ERRORS as err:
             _LOGGER.error("Failed to send command %s: %s", command_name, err)
+            # Force the next send back through async_connect; in direct
+            # mode also drop methods bound to the dead connection
+            self._connected = False
+            if self.connection_mode == MODE_DIRECT:
+                self._direct_methods.clear()
             return False
 
-    def _map_command_to_endpoint(self, command_name: str) -> str | None:
-        """Map internal command name to API endpoint."""
-        # Position controls
-        if command_name == "head_up":
-            return "/head/up"
-        elif command_name == "head_down":
-            return "/head/down"
-        elif command_name == "lumbar_up":
-            return "/lumbar/up"
-        elif command_name == "lumbar_down":
-            return "/lumbar/down"
-        elif command_name == "foot_up":
-            return "/foot/up"
-        elif command_name == "foot_down":
-            return "/foot/down"
-        elif command_name == "stop":
-            return "/stop"
-        # Presets
-        elif command_name == "flat":
-            return "/preset/flat"
-        elif command_name == "zero_gravity":
-            return "/preset/zero-gravity"
-        elif command_name == "anti_snore":
-            return "/preset/anti-snore"
-        elif command_name == "tv_position":
-            return "/preset/tv"
-        elif command_name == "lounge":
-            return "/preset/lounge"
-        # Massage
-        elif command_name == "massage_on":
-            return "/massage/on"
-        elif command_name == "massage_off":
-            return "/massage/off"
-        # Lighting
-        elif command_name == "light_on":
-            return "/light/on"
-        elif command_name == "light_off":
-            return "/light/off"
-        elif command_name == "light_toggle":
-            return "/light/toggle"
-        else:
-            return None
-
     async def async_start_continuous_movement(
         self, movement_id: str, command_name: str, interval: float = 0.5
     ) -> None:
@@ -190,29 +291,63 @@ class OkinBedCoordinator(DataUpdateCoordinator):
             command_name: Method name to call on OkinBed (e.g., "head_up")
             interval: Time between command sends in seconds
         """
+        # If the same movement is already running, leave it alone - HA can
+        # re-dispatch open/close while the button is held
+        existing = self._active_movements.get(movement_id)
+        if existing is not None:
+            task, existing_command = existing
+            if existing_command == command_name and not task.done():
+                _LOGGER.debug("Continuous movement already active: %s", movement_id)
+                return
+
         # Cancel existing movement with this ID
         await self.async_stop_continuous_movement(movement_id)
 
+        # Connect once here; the loop itself skips the per-tick check
+        if not await self.async_connect():
+            _LOGGER.error("Cannot start movement %s: not connected", movement_id)
+            return
+
         async def _continuous_send():
-            """Repeatedly send command."""
+            """Repeatedly send command on a fixed cadence.
+
+            Schedules against the monotonic loop clock so slow BLE writes don't
+            stretch the period or let drift accumulate.
+            """
+            loop = asyncio.get_running_loop()
+            next_tick = loop.time()
+            behind_count = 0
             while True:
                 try:
-                    await self.async_send_command(command_name)
-                    await asyncio.sleep(interval)
+                    await self._async_send_command_fast(command_name)
+                    next_tick += interval
+                    sleep_for = next_tick - loop.time()
+                    if sleep_for <= 0:
+                        # Sends are running longer than the interval; after a
+                        # few late ticks, re-anchor instead of bursting to
+                        # catch up
+                        behind_count += 1
+                        if behind_count >= 3:
+                            next_tick = loop.time() + interval
+                            behind_count = 0
+                        sleep_for = 0
+                    else:
+                        behind_count = 0
+                    await asyncio.sleep(sleep_for)
                 except asyncio.CancelledError:
                     _LOGGER.debug("Continuous movement cancelled: %s", movement_id)
                     break
-                except Exception as err:
+                except _TRANSPORT_ERRORS as err:
                     _LOGGER.error("Error in continuous movement %s: %s", movement_id, err)
                     break
 
         task = self.hass.async_create_task(_continuous_send())
-        self._active_movements[movement_id] = task
+        self._active_movements[movement_id] = (task, command_name)
         _LOGGER.debug("Started continuous movement: %s", movement_id)
 
     async def async_stop_continuous_movement(self, movement_id: str) -> None:
         """Stop a continuous movement."""
-        task = self._active_movements.pop(movement_id, None)
+        task, _command = self._active_movements.pop(movement_id, (None, None))
         if task and not task.done():
             task.cancel()
             try:
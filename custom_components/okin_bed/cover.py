@@ -1,5 +1,6 @@
 """Support for OKIN Bed covers (bed sections)."""
 
+import asyncio
 import logging
 from typing import Any
 
@@ -12,7 +13,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, CONF_DEVICE_NAME, MOVEMENT_COMMAND_INTERVAL
+from .const import CONF_DEVICE_NAME, MOVEMENT_COMMAND_INTERVAL
 from .coordinator import OkinBedCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,7 +25,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up OKIN Bed cover entities."""
-    coordinator: OkinBedCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: OkinBedCoordinator = config_entry.runtime_data
     device_name = config_entry.data[CONF_DEVICE_NAME]
 
     entities = [
@@ -42,6 +43,13 @@ class OkinBedSection(CoverEntity):
     Press and hold behavior: Repeatedly sends commands while user holds button.
     """
 
+    __slots__ = (
+        "coordinator",
+        "_section",
+        "_movement_id_up",
+        "_movement_id_down",
+    )
+
     _attr_device_class = CoverDeviceClass.AWNING
     _attr_supported_features = (
         CoverEntityFeature.OPEN
@@ -61,26 +69,15 @@ class OkinBedSection(CoverEntity):
         self._section = section
         self._attr_name = f"{device_name} {section_name}"
         self._attr_unique_id = f"{coordinator.mac_address}_{section}"
+        # Movement ids double as the coordinator command names; build the
+        # strings once instead of per press
         self._movement_id_up = f"{section}_up"
         self._movement_id_down = f"{section}_down"
-        self._is_opening = False
-        self._is_closing = False
-
-    @property
-    def is_opening(self) -> bool:
-        """Return if the cover is opening."""
-        return self._is_opening
-
-    @property
-    def is_closing(self) -> bool:
-        """Return if the cover is closing."""
-        return self._is_closing
-
-    @property
-    def is_closed(self) -> bool | None:
-        """Return if the cover is closed."""
-        # OKIN beds don't provide position feedback
-        return None
+        # Plain _attr_* state lets HA skip property dispatch on every read;
+        # is_closed stays None because OKIN beds give no position feedback
+        self._attr_is_opening = False
+        self._attr_is_closing = False
+        self._attr_is_closed = None
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover (raise section).
@@ -88,14 +85,14 @@ class OkinBedSection(CoverEntity):
         Starts continuous movement that repeats commands while held.
         """
         _LOGGER.info("Opening %s section (press and hold)", self._section)
-        self._is_opening = True
-        self._is_closing = False
+        self._attr_is_opening = True
+        self._attr_is_closing = False
         self.async_write_ha_state()
 
         # Start continuous movement
         await self.coordinator.async_start_continuous_movement(
             self._movement_id_up,
-            f"{self._section}_up",
+            self._movement_id_up,
             MOVEMENT_COMMAND_INTERVAL,
         )
 
@@ -105,27 +102,28 @@ class OkinBedSection(CoverEntity):
         Starts continuous movement that repeats commands while held.
         """
         _LOGGER.info("Closing %s section (press and hold)", self._section)
-        self._is_closing = True
-        self._is_opening = False
+        self._attr_is_closing = True
+        self._attr_is_opening = False
         self.async_write_ha_state()
 
         # Start continuous movement
         await self.coordinator.async_start_continuous_movement(
             self._movement_id_down,
-            f"{self._section}_down",
+            self._movement_id_down,
             MOVEMENT_COMMAND_INTERVAL,
         )
 
     async def async_stop_cover(self, **kwargs: Any) -> None:
         """Stop the cover."""
         _LOGGER.info("Stopping %s section", self._section)
-        self._is_opening = False
-        self._is_closing = False
+        self._attr_is_opening = False
+        self._attr_is_closing = False
         self.async_write_ha_state()
 
-        # Stop continuous movements for this section
-        await self.coordinator.async_stop_continuous_movement(self._movement_id_up)
-        await self.coordinator.async_stop_continuous_movement(self._movement_id_down)
-
-        # Send stop command to bed
-        await self.coordinator.async_send_command("stop")
+        # Cancel both hold loops and send the stop command concurrently so the
+        # bed stops as soon as possible after release
+        await asyncio.gather(
+            self.coordinator.async_stop_continuous_movement(self._movement_id_up),
+            self.coordinator.async_stop_continuous_movement(self._movement_id_down),
+            self.coordinator.async_send_command("stop"),
+        )
@@ -6,16 +6,30 @@ and exposes HTTP endpoints for remote control from Home Assistant or other clien
 
 import asyncio
 import logging
-import re
-from typing import Optional, Dict
+import time
+from typing import Optional, Dict, List
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
-from fastapi import FastAPI, HTTPException, Body, Query
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# orjson serializes responses in native code; fall back to the stdlib
+# encoder when it isn't installed
+try:
+    import orjson
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    DefaultResponse = JSONResponse
+
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 from .bed import OkinBed
-from .constants import MassageWave
+from .constants import COMMAND_VIEWS
 
 # Configure logging
 logging.basicConfig(
@@ -27,50 +41,561 @@ logger = logging.getLogger(__name__)
 # Global bed instances dictionary (keyed by MAC address)
 bed_instances: Dict[str, OkinBed] = {}
 
-# MAC address validation pattern
-MAC_ADDRESS_PATTERN = re.compile(r'^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$')
+# MAC address validation tables. The format is fixed at 17 characters, so
+# a table lookup per character beats running the regex engine: positions
+# 2/5/8/11/14 must be ':' or '-', the rest hex digits.
+_MAC_SEP_POSITIONS = (2, 5, 8, 11, 14)
+_MAC_HEX_POSITIONS = tuple(i for i in range(17) if i not in _MAC_SEP_POSITIONS)
+_MAC_HEX_TABLE = bytes(
+    1 if chr(c) in "0123456789abcdefABCDEF" else 0 for c in range(256)
+)
+
+
+def _fast_valid_mac(mac: str) -> bool:
+    """Validate XX:XX:XX:XX:XX:XX (':' or '-' separators) without regex."""
+    if len(mac) != 17:
+        return False
+    try:
+        raw = mac.encode("ascii")
+    except UnicodeEncodeError:
+        return False
+    for pos in _MAC_SEP_POSITIONS:
+        if raw[pos] != 0x3A and raw[pos] != 0x2D:  # ':' or '-'
+            return False
+    return all(_MAC_HEX_TABLE[raw[i]] for i in _MAC_HEX_POSITIONS)
+
+
+# Uppercases a-f and rewrites '-' separators to ':' in one C-level pass,
+# replacing the .upper().replace() double scan
+_MAC_TRANS = str.maketrans(
+    {**{chr(c): chr(c - 32) for c in range(ord('a'), ord('f') + 1)}, '-': ':'}
+)
+
+# Keep-warm timers. The warm interval paces a benign GATT read that keeps
+# the link-layer attached - a cold BLE connection takes 10-15s to set up,
+# so idle users would otherwise pay that on every first command. Each
+# connected bed arms its own call_later deadline on asyncio's timer heap
+# instead of one task scanning the whole bed dict every tick.
+_keep_warm_handles: Dict[str, asyncio.TimerHandle] = {}
+_state_save_handle: Optional[asyncio.TimerHandle] = None
+KEEP_WARM_INTERVAL = 20  # seconds between keep-warm reads
+KEEP_ALIVE_INTERVAL = 300  # 5 minutes between state saves
+
+# Single writer task - every endpoint submits onto this queue instead of
+# taking a lock per request, and commands fired back-to-back (e.g. HA
+# scene activation) coalesce into one BLE write burst instead of paying a
+# full connection-interval round trip each
+command_queue: Optional[asyncio.Queue] = None
+command_worker_task: Optional[asyncio.Task] = None
+MAX_BATCH = 3  # max commands coalesced per burst
+BATCH_WINDOW = 0.015  # seconds to wait for follow-up commands
+
+# Serialize all BLE traffic through one lock - the adapter is single-owner
+# and interleaved GATT writes from concurrent requests can be rejected by
+# the bed firmware, showing up as timeouts and retries
+_bed_lock = asyncio.Lock()
+
+# Duplicate-command coalescing for toggle-style endpoints - an automation
+# storm re-sending /massage/on at 10 Hz should hit the radio once
+DEDUPE_INTERVAL = 0.1  # seconds
+_DEDUPE_MAX_ENTRIES = 256  # prune threshold; real traffic is beds x commands
+_last_commands: Dict[tuple, float] = {}
+
+
+def is_duplicate_command(mac: str, command: str) -> bool:
+    """Return True if this (bed, command) pair fired within DEDUPE_INTERVAL.
+
+    Keys on the *normalized* MAC so AA:BB:... and aa:bb:... coalesce
+    together; invalid MACs never enter the cache (the endpoint rejects
+    them downstream anyway).
+    """
+    normalized = _normalize_mac(mac)
+    if normalized is None:
+        return False
+
+    now = time.monotonic()
+    if len(_last_commands) >= _DEDUPE_MAX_ENTRIES:
+        # Anything outside the dedupe window is dead weight; drop it so
+        # the cache stays bounded no matter what clients throw at it
+        cutoff = now - DEDUPE_INTERVAL
+        for stale in [k for k, ts in _last_commands.items() if ts < cutoff]:
+            del _last_commands[stale]
+
+    key = (normalized, command)
+    last = _last_commands.get(key)
+    _last_commands[key] = now
+    return last is not None and (now - last) < DEDUPE_INTERVAL
+
+# Command frames by name, for the writer task and the pipeline endpoint.
+# Values are zero-copy views into the shared command pool in constants.
+COMMAND_BYTES = {
+    # Position controls
+    "head_up": COMMAND_VIEWS["head_up"],
+    "head_down": COMMAND_VIEWS["head_down"],
+    "lumbar_up": COMMAND_VIEWS["lumbar_up"],
+    "lumbar_down": COMMAND_VIEWS["lumbar_down"],
+    "foot_up": COMMAND_VIEWS["foot_up"],
+    "foot_down": COMMAND_VIEWS["foot_down"],
+    "stop": COMMAND_VIEWS["stop"],
+    # Presets
+    "flat": COMMAND_VIEWS["flat"],
+    "zero_gravity": COMMAND_VIEWS["zero_gravity"],
+    "anti_snore": COMMAND_VIEWS["anti_snore"],
+    "tv_position": COMMAND_VIEWS["lounge"],  # TV mode shares the lounge command
+    "lounge": COMMAND_VIEWS["lounge"],
+    # Massage
+    "massage_on": COMMAND_VIEWS["massage_on"],
+    "massage_off": COMMAND_VIEWS["massage_off"],
+    # Lighting
+    "light_on": COMMAND_VIEWS["light_on"],
+    "light_off": COMMAND_VIEWS["light_off"],
+    "light_toggle": COMMAND_VIEWS["light_toggle"],
+}
+
+# Pre-configured beds (set via environment variables or config file)
+# Format: Comma-separated MAC addresses, e.g., "AA:BB:CC:DD:EE:FF,11:22:33:44:55:66"
+import os
+import json
+from pathlib import Path
+
+# BLE connection interval tuning (milliseconds). A shorter interval cuts the
+# wait before each command hits the air; requires root and Linux debugfs.
+# 0 disables tuning. Overridable via --conn-interval-ms on the CLI.
+CONN_INTERVAL_MS = float(os.environ.get('OKIN_CONN_INTERVAL_MS', '0'))
+
+PRECONFIGURED_BEDS = os.environ.get('OKIN_BED_MACS', '').strip()
+AUTO_CONNECT_ON_STARTUP = os.environ.get('OKIN_AUTO_CONNECT', 'true').lower() == 'true'
+AUTO_SAVE_CONNECTIONS = os.environ.get('OKIN_AUTO_SAVE', 'true').lower() == 'true'
+WARMUP_ON_STARTUP = os.environ.get('OKIN_WARMUP', 'true').lower() == 'true'
+
+# Persistent state file for remembering connected beds
+# Try /var/lib first, fallback to home directory if permission denied
+default_state_path = '/var/lib/okin-bed/state.json'
+fallback_state_path = str(Path.home() / '.okin-bed' / 'state.json')
+
+STATE_FILE_PATH = os.environ.get('OKIN_STATE_FILE', default_state_path)
+STATE_FILE = Path(STATE_FILE_PATH)
+
+# Try to create state directory, fallback to home directory if permission denied
+try:
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+except PermissionError:
+    logger.warning("Cannot create %s, using home directory instead", STATE_FILE.parent)
+    STATE_FILE = Path(fallback_state_path)
+    STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    logger.info("State file location: %s", STATE_FILE)
 
 
 class BedConfig(BaseModel):
     """Bed configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
     mac_address: str = Field(..., description="Bluetooth MAC address of the bed")
 
 
 class MassageConfig(BaseModel):
     """Massage configuration."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
     wave: str = Field(..., description="Massage wave pattern")
     intensity: int = Field(1, ge=1, le=10, description="Massage intensity (1-10)")
 
 
 class CommandResponse(BaseModel):
     """Standard command response."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
     success: bool
     message: str
     command: str
 
 
+class PipelineRequest(BaseModel):
+    """A sequence of commands to dispatch as one write burst."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    commands: List[str] = Field(..., description="Command names to send in order")
+
+
+# Command ack payloads are identical on every call; serialize each once
+# and replay the same Response object, skipping model validation and JSON
+# encoding per request
+_RESPONSE_CACHE: Dict[tuple, Response] = {}
+
+
+def command_response(command: str, message: str) -> Response:
+    """Return the pre-serialized success response for a command endpoint."""
+    key = (command, message)
+    response = _RESPONSE_CACHE.get(key)
+    if response is None:
+        body = _json_dumps({
+            "success": True,
+            "message": message,
+            "command": command,
+        })
+        response = _RESPONSE_CACHE[key] = Response(
+            content=body, media_type="application/json"
+        )
+    return response
+
+
+@lru_cache(maxsize=32)
+def _normalize_mac(mac: str) -> Optional[str]:
+    """Normalize a MAC to uppercase colon form, or None if invalid.
+
+    Cached by raw input string - the same handful of beds is addressed on
+    every request, so validation becomes a dict lookup after the first hit.
+    """
+    if not _fast_valid_mac(mac):
+        return None
+    return mac.translate(_MAC_TRANS)
+
+
 def validate_mac_address(mac: str) -> str:
     """Validate and normalize MAC address format."""
-    if not MAC_ADDRESS_PATTERN.match(mac):
+    normalized = _normalize_mac(mac)
+    if normalized is None:
         raise HTTPException(
             status_code=400,
             detail=f"Invalid MAC address format: {mac}. Expected format: XX:XX:XX:XX:XX:XX"
         )
-    # Normalize to uppercase with colons
-    return mac.upper().replace('-', ':')
+    return normalized
+
+
+def _schedule_reconnect(bed: OkinBed):
+    """Disconnect callback - reconnect on the event instead of polling.
+
+    Runs from bleak's disconnect notification, so reconnects start the
+    moment the link drops rather than on the next timer tick.
+    """
+    async def _reconnect():
+        try:
+            async with _bed_lock:
+                if await bed.connect():
+                    _schedule_keep_warm(bed)
+        except Exception as e:
+            logger.warning("Reconnect after disconnect failed for %s: %s", bed.mac_address, e)
+        finally:
+            _bump_status_gen()
+
+    _bump_status_gen()
+    _cancel_keep_warm(bed.mac_address)
+    try:
+        asyncio.get_running_loop().create_task(_reconnect())
+    except RuntimeError:
+        # No running loop (shutdown); get_bed reconnects on demand
+        pass
+
+
+def _new_bed(mac: str) -> OkinBed:
+    """Create a bed instance wired for event-driven reconnect."""
+    bed = OkinBed(mac_address=mac)
+    bed.on_disconnect = _schedule_reconnect
+    _bump_status_gen()
+    return bed
+
+
+def _schedule_keep_warm(bed: OkinBed):
+    """Arm (or rearm) the keep-warm timer for one bed.
+
+    Reconnects are event-driven via the disconnect callback; these timers
+    only keep established links attached. Healthy beds cost a single heap
+    pop every KEEP_WARM_INTERVAL with no interpreter wake-ups in between.
+    """
+    _cancel_keep_warm(bed.mac_address)
+    loop = asyncio.get_running_loop()
+    _keep_warm_handles[bed.mac_address] = loop.call_later(
+        KEEP_WARM_INTERVAL,
+        lambda: asyncio.ensure_future(_keep_warm_ping(bed)),
+    )
+
+
+def _cancel_keep_warm(mac: str):
+    """Drop the keep-warm timer for a bed, if armed."""
+    handle = _keep_warm_handles.pop(mac, None)
+    if handle is not None:
+        handle.cancel()
+
+
+async def _keep_warm_ping(bed: OkinBed):
+    """Touch one bed's connection, rearming its timer while the link is up."""
+    if not (bed.client and bed.client.is_connected):
+        # Link dropped; the disconnect callback owns reconnects and rearms
+        # keep-warm once the bed is back
+        _keep_warm_handles.pop(bed.mac_address, None)
+        return
+
+    try:
+        logger.debug("Keep-warm read to %s", bed.mac_address)
+        async with _bed_lock:
+            await bed._noop_read()
+    except Exception as e:
+        logger.warning("Keep-warm read failed for %s: %s", bed.mac_address, e)
+
+    _schedule_keep_warm(bed)
+
+
+def _schedule_state_save():
+    """Rearm the periodic state save on the loop's timer heap."""
+    global _state_save_handle
+
+    def _save_and_rearm():
+        try:
+            save_connected_beds()
+        except Exception as e:
+            logger.error("State save failed: %s", e)
+        _schedule_state_save()
+
+    _state_save_handle = asyncio.get_running_loop().call_later(
+        KEEP_ALIVE_INTERVAL, _save_and_rearm
+    )
+
+
+def tune_connection_interval(interval_ms: float, adapter: str = "hci0"):
+    """Request a shorter BLE connection interval via debugfs (Linux, root only).
+
+    Values are written in 1.25 ms units to the kernel's conn_min/max_interval
+    knobs. Failures (non-Linux, non-root, missing debugfs) are logged and
+    ignored - the server works fine at the default interval, just slower.
+    """
+    if interval_ms <= 0:
+        return
+
+    units = max(6, int(interval_ms / 1.25))  # kernel minimum is 6 (7.5 ms)
+    base = Path(f"/sys/kernel/debug/bluetooth/{adapter}")
+    try:
+        (base / "conn_min_interval").write_text(f"{units}\n")
+        (base / "conn_max_interval").write_text(f"{units + 4}\n")
+        logger.info(
+            f"BLE connection interval set to {units * 1.25:.2f}-"
+            f"{(units + 4) * 1.25:.2f} ms on {adapter}"
+        )
+    except (OSError, PermissionError) as e:
+        logger.warning("Could not tune BLE connection interval: %s", e)
+
+
+async def command_batch_worker():
+    """Drain queued commands, coalescing bursts into one lock hold per bed.
+
+    Frames are written individually - concatenating them would blow the
+    write-without-response budget (MTU-3 = 20 bytes) whenever the link sits
+    at the default MTU of 23, and nothing in the captured protocol shows
+    the firmware parsing multiple frames out of one ATT write. The win
+    here is serialization plus amortizing the lock and connection event
+    over a burst, not packing bytes.
+    """
+    while True:
+        try:
+            first = await command_queue.get()
+            batch = [first]
+            # Collect follow-up commands arriving within the batch window
+            while len(batch) < MAX_BATCH:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(command_queue.get(), timeout=BATCH_WINDOW)
+                    )
+                except asyncio.TimeoutError:
+                    break
+
+            # One lock hold per bed, frames written back-to-back
+            groups: Dict[str, list] = {}
+            for item in batch:
+                groups.setdefault(item[0].mac_address, []).append(item)
+
+            for items in groups.values():
+                bed = items[0][0]
+                try:
+                    async with _bed_lock:
+                        # _send_command keeps the movement-frame pacing that
+                        # the firmware needs between repeated position writes
+                        for _, command, _ in items:
+                            await bed._send_command(command)
+                    for _, _, future in items:
+                        if not future.done():
+                            future.set_result(True)
+                except Exception as e:
+                    for _, _, future in items:
+                        if not future.done():
+                            future.set_exception(e)
+
+        except asyncio.CancelledError:
+            logger.info("Command batch worker cancelled")
+            break
+        except Exception as e:
+            logger.error("Command batch worker error: %s", e)
+
+
+async def _submit_payload(bed: OkinBed, payload: bytes):
+    """Hand a raw payload to the writer task and wait for the write."""
+    future = asyncio.get_running_loop().create_future()
+    await command_queue.put((bed, payload, future))
+    await future
+
+
+async def submit_command(mac: str, command_name: str):
+    """Queue a command for the single writer task and wait for the write."""
+    bed = await get_bed(mac)
+    await _submit_payload(bed, COMMAND_BYTES[command_name])
+
+
+def load_saved_beds():
+    """Load previously connected bed MAC addresses from state file."""
+    try:
+        if STATE_FILE.exists():
+            with open(STATE_FILE, 'r') as f:
+                state = json.load(f)
+                saved_macs = state.get('connected_beds', [])
+                if saved_macs:
+                    logger.info("Loaded %s bed(s) from state file: %s", len(saved_macs), ', '.join(saved_macs))
+                    return saved_macs
+    except Exception as e:
+        logger.warning("Could not load state file: %s", e)
+    return []
+
+
+def save_connected_beds():
+    """Save currently connected bed MAC addresses to state file."""
+    if not AUTO_SAVE_CONNECTIONS:
+        return
+
+    try:
+        connected_macs = [
+            mac for mac, bed in bed_instances.items()
+            if bed.client and bed.client.is_connected
+        ]
+
+        state = {'connected_beds': connected_macs}
+
+        with open(STATE_FILE, 'w') as f:
+            json.dump(state, f, indent=2)
+
+        logger.debug("Saved %s connected bed(s) to state file", len(connected_macs))
+
+    except Exception as e:
+        logger.warning("Could not save state file: %s", e)
+
+
+async def auto_connect_beds():
+    """Auto-connect to pre-configured or previously connected beds on startup."""
+    mac_addresses = []
+
+    # First, try environment variable
+    if PRECONFIGURED_BEDS:
+        mac_addresses = [mac.strip().translate(_MAC_TRANS) for mac in PRECONFIGURED_BEDS.split(',') if mac.strip()]
+        logger.info("Using pre-configured beds from environment: %s", ', '.join(mac_addresses))
+    # Otherwise, load from saved state
+    else:
+        saved_macs = load_saved_beds()
+        if saved_macs:
+            mac_addresses = saved_macs
+            logger.info("Using previously connected beds from state file")
+        else:
+            logger.info("No pre-configured beds. Beds will connect on first command and be remembered.")
+            return
+
+    if not mac_addresses:
+        return
+
+    logger.info("Auto-connecting to %s bed(s)...", len(mac_addresses))
+
+    # Create instances first, then connect concurrently - BLE setup is
+    # radio wait time, so total startup is max(connect) rather than sum
+    pairs = []
+    for mac in mac_addresses:
+        # Validate MAC format
+        if not _fast_valid_mac(mac):
+            logger.warning("Invalid MAC address format: %s", mac)
+            continue
+
+        if mac not in bed_instances:
+            logger.info("Creating bed instance for %s", mac)
+            bed_instances[mac] = _new_bed(mac)
+
+        pairs.append((mac, bed_instances[mac]))
+
+    if not pairs:
+        return
+
+    results = await asyncio.gather(
+        *(bed.connect() for _, bed in pairs), return_exceptions=True
+    )
+
+    for (mac, bed), result in zip(pairs, results):
+        if isinstance(result, Exception):
+            logger.error("Error connecting to %s: %s", mac, result)
+        elif result:
+            logger.info("✓ Successfully connected to %s", mac)
+            _schedule_keep_warm(bed)
+        else:
+            logger.warning("✗ Failed to connect to %s (will retry on first command)", mac)
+
+    _bump_status_gen()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage bed connection lifecycle."""
+    global command_queue, command_worker_task
+
     logger.info("OKIN Bed API Server starting...")
+
+    # Python 3.12+: eager tasks run synchronously until their first real
+    # suspension instead of always bouncing through the scheduler, which
+    # skips a loop round-trip on fast paths like get_bed()'s
+    # already-connected case
+    eager_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_factory)
+
+    # Tune the BLE connection interval if configured (best effort)
+    tune_connection_interval(CONN_INTERVAL_MS)
+
+    # Auto-connect to pre-configured beds
+    if AUTO_CONNECT_ON_STARTUP:
+        await auto_connect_beds()
+
+    # Warm the one-time costs out of the first real request: pre-build
+    # every cached ack response, the status responses, and the OpenAPI
+    # schema so boot pays them instead of the first command after boot
+    if WARMUP_ON_STARTUP:
+        for action, message in _ACTION_MESSAGES.items():
+            command_response(action, message)
+        _root_payload(_status_gen)
+        _health_payload(_status_gen)
+        app.openapi()
+        logger.info("Warmed %s command responses and the OpenAPI schema", len(_ACTION_MESSAGES))
+
+    # Arm the periodic state save; per-bed keep-warm timers are armed as
+    # connections come up
+    _schedule_state_save()
+    logger.info("Keep-warm timers armed (every %ss per connected bed)", KEEP_WARM_INTERVAL)
+
+    # Start the command batch worker
+    command_queue = asyncio.Queue()
+    command_worker_task = asyncio.create_task(command_batch_worker())
+    logger.info("Command batch worker started (window: %ss, max: %s)", BATCH_WINDOW, MAX_BATCH)
+
     yield
+
+    # Cancel keep-warm and state-save timers
+    for mac in list(_keep_warm_handles):
+        _cancel_keep_warm(mac)
+    if _state_save_handle is not None:
+        _state_save_handle.cancel()
+
+    # Cancel command batch worker
+    if command_worker_task:
+        command_worker_task.cancel()
+        try:
+            await command_worker_task
+        except asyncio.CancelledError:
+            pass
+
+    # Save state before shutdown
+    save_connected_beds()
+
     # Cleanup on shutdown - disconnect all beds
     if bed_instances:
-        logger.info(f"Disconnecting from {len(bed_instances)} bed(s)...")
+        logger.info("Disconnecting from %s bed(s)...", len(bed_instances))
         for mac, bed in bed_instances.items():
-            if bed.is_connected:
-                logger.info(f"Disconnecting from bed {mac}")
+            if bed.client and bed.client.is_connected:
+                logger.info("Disconnecting from bed %s", mac)
                 await bed.disconnect()
     logger.info("OKIN Bed API Server stopped")
 
@@ -80,65 +605,145 @@ app = FastAPI(
     description="REST API for controlling OKIN adjustable beds via Bluetooth LE",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=DefaultResponse,
 )
 
 
+# Cap on-demand reconnects so a dead bed doesn't hold HTTP requests for the
+# library's full 30s BLE timeout
+GET_BED_CONNECT_TIMEOUT = 10.0
+
+
+async def _await_with_timeout(coro, timeout: float):
+    """Await a coroutine with a deadline, using a bare timer handle.
+
+    Avoids the per-call context-manager setup/teardown of async_timeout-style
+    wrappers on the reconnect hot path.
+    """
+    loop = asyncio.get_running_loop()
+    task = loop.create_task(coro)
+    timed_out = False
+
+    def _cancel():
+        nonlocal timed_out
+        timed_out = True
+        task.cancel()
+
+    handle = loop.call_later(timeout, _cancel)
+    try:
+        return await task
+    except asyncio.CancelledError:
+        if timed_out:
+            raise asyncio.TimeoutError(f"Operation timed out after {timeout}s")
+        raise
+    finally:
+        handle.cancel()
+
+
 async def get_bed(mac_address: str) -> OkinBed:
     """Get or create bed instance for given MAC address.
 
     Maintains persistent connections to beds, creating new instances as needed.
     """
-    global bed_instances
+    # Fast path: a MAC already in the instance cache was validated when it
+    # was first seen, so a connected bed costs one dict get and two
+    # attribute reads
+    bed = bed_instances.get(mac_address)
+    if bed is not None:
+        client = bed.client
+        if client is not None and client.is_connected:
+            return bed
 
     # Validate and normalize MAC address
     mac = validate_mac_address(mac_address)
 
     # Get or create bed instance for this MAC
     if mac not in bed_instances:
-        logger.info(f"Creating new bed instance for {mac}")
-        bed_instances[mac] = OkinBed(mac_address=mac)
+        logger.info("Creating new bed instance for %s", mac)
+        bed_instances[mac] = _new_bed(mac)
 
     bed = bed_instances[mac]
 
     # Ensure connection
-    if not bed.is_connected:
+    if not bed.client or not bed.client.is_connected:
         try:
-            logger.info(f"Connecting to bed {mac}")
-            await bed.connect()
+            logger.info("Connecting to bed %s", mac)
+            async with _bed_lock:
+                connected = await _await_with_timeout(bed.connect(), GET_BED_CONNECT_TIMEOUT)
+            if not connected:
+                logger.error("Failed to connect to bed %s", mac)
+                raise HTTPException(
+                    status_code=503,
+                    detail=f"Failed to connect to bed {mac}. Check bed is powered on and in range."
+                )
         except Exception as e:
-            logger.error(f"Failed to connect to bed {mac}: {e}")
+            logger.error("Failed to connect to bed %s: %s", mac, e)
             raise HTTPException(
                 status_code=503,
                 detail=f"Failed to connect to bed {mac}: {str(e)}"
             )
+        _bump_status_gen()
+        _schedule_keep_warm(bed)
 
     return bed
 
 
-@app.get("/")
-async def root():
-    """Root endpoint with API information."""
-    connected_beds = {
-        mac: bed.is_connected
-        for mac, bed in bed_instances.items()
-    }
-    return {
+# Status payloads for / and /health only change when a bed is added or a
+# connection comes or goes. A generation counter bumped on those
+# transitions keys an lru_cache of pre-serialized Response objects, so
+# HA's frequent polls cost a dict hit and a socket write - no walk over
+# every bed's is_connected (a D-Bus round trip each under BlueZ) and no
+# JSON encoding per request.
+_status_gen = 0
+
+
+def _bump_status_gen():
+    """Invalidate the cached / and /health payloads."""
+    global _status_gen
+    _status_gen += 1
+
+
+def _connected_map() -> Dict[str, bool]:
+    connected_beds = {}
+    for mac, bed in bed_instances.items():
+        client = bed.client  # one attribute walk per bed, not two
+        connected_beds[mac] = bool(client and client.is_connected)
+    return connected_beds
+
+
+@lru_cache(maxsize=2)
+def _root_payload(gen: int) -> Response:
+    body = _json_dumps({
         "name": "OKIN Bed Control API",
         "version": "2.0.0",
         "status": "online",
-        "connected_beds": connected_beds,
+        "connected_beds": _connected_map(),
         "total_beds": len(bed_instances),
-    }
+        "single_writer": True,
+    })
+    return Response(content=body, media_type="application/json")
 
 
-@app.get("/health")
-async def health():
-    """Health check endpoint."""
-    return {
+@lru_cache(maxsize=2)
+def _health_payload(gen: int) -> Response:
+    body = _json_dumps({
         "status": "healthy",
         "total_beds": len(bed_instances),
-        "connected_beds": sum(1 for bed in bed_instances.values() if bed.is_connected),
-    }
+        "connected_beds": sum(_connected_map().values()),
+    })
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/", response_class=Response)
+async def root():
+    """Root endpoint with API information."""
+    return _root_payload(_status_gen)
+
+
+@app.get("/health", response_class=Response)
+async def health():
+    """Health check endpoint."""
+    return _health_payload(_status_gen)
 
 
 @app.post("/config")
@@ -148,13 +753,11 @@ async def configure_bed(config: BedConfig):
     Note: With multi-bed support, this endpoint is optional.
     Beds are auto-configured on first command.
     """
-    global bed_instances
-
     mac = validate_mac_address(config.mac_address)
 
     if mac not in bed_instances:
-        bed_instances[mac] = OkinBed(mac_address=mac)
-        logger.info(f"Pre-configured bed: {mac}")
+        bed_instances[mac] = _new_bed(mac)
+        logger.info("Pre-configured bed: %s", mac)
 
     return {
         "success": True,
@@ -177,14 +780,14 @@ async def connect(mac: str = Query(..., description="Bluetooth MAC address of th
 @app.post("/disconnect")
 async def disconnect(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
     """Disconnect from specific bed."""
-    global bed_instances
-
     mac_normalized = validate_mac_address(mac)
 
     if mac_normalized in bed_instances:
         bed = bed_instances[mac_normalized]
-        if bed.is_connected:
+        if bed.client and bed.client.is_connected:
+            _cancel_keep_warm(mac_normalized)
             await bed.disconnect()
+            _bump_status_gen()
             return {
                 "success": True,
                 "message": f"Disconnected from bed {mac_normalized}"
@@ -196,144 +799,217 @@ async def disconnect(mac: str = Query(..., description="Bluetooth MAC address of
     }
 
 
-# Position control endpoints
-@app.post("/head/up", response_model=CommandResponse)
-async def head_up(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
-    """Raise head section."""
-    bed = await get_bed(mac)
-    await bed.head_up()
-    return CommandResponse(success=True, message="Head up", command="head_up")
-
-
-@app.post("/head/down", response_model=CommandResponse)
-async def head_down(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
-    """Lower head section."""
-    bed = await get_bed(mac)
-    await bed.head_down()
-    return CommandResponse(success=True, message="Head down", command="head_down")
-
-
-@app.post("/lumbar/up", response_model=CommandResponse)
-async def lumbar_up(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
-    """Raise lumbar section."""
-    bed = await get_bed(mac)
-    await bed.lumbar_up()
-    return CommandResponse(success=True, message="Lumbar up", command="lumbar_up")
-
-
-@app.post("/lumbar/down", response_model=CommandResponse)
-async def lumbar_down(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
-    """Lower lumbar section."""
-    bed = await get_bed(mac)
-    await bed.lumbar_down()
-    return CommandResponse(success=True, message="Lumbar down", command="lumbar_down")
-
-
-@app.post("/foot/up", response_model=CommandResponse)
-async def foot_up(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
-    """Raise foot section."""
-    bed = await get_bed(mac)
-    await bed.foot_up()
-    return CommandResponse(success=True, message="Foot up", command="foot_up")
+@app.post("/commands/pipeline")
+async def commands_pipeline(
+    request: PipelineRequest,
+    mac: str = Query(..., description="Bluetooth MAC address of the bed"),
+):
+    """Send several commands as one pipelined write burst.
 
+    Frames are written per-command without response or per-write acks, so
+    the stack can pack them into as few connection events as the link
+    allows. They are not concatenated into one ATT write - a joined
+    payload overruns the default-MTU write budget at 3+ commands.
+    """
+    unknown = [name for name in request.commands if name not in COMMAND_BYTES]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown command(s): {', '.join(unknown)}"
+        )
+    if not request.commands:
+        raise HTTPException(status_code=400, detail="No commands given")
 
-@app.post("/foot/down", response_model=CommandResponse)
-async def foot_down(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
-    """Lower foot section."""
     bed = await get_bed(mac)
-    await bed.foot_down()
-    return CommandResponse(success=True, message="Foot down", command="foot_down")
+    frames = [COMMAND_BYTES[name] for name in request.commands]
+    async with _bed_lock:
+        await bed.send_batch(frames)
+    return {"success": True, "count": len(request.commands)}
+
+
+# Position control endpoints - all share the get_bed/dispatch/respond shape,
+# so generate them from a table instead of 7 hand-written handlers
+POSITION_ROUTES = [
+    ("/head/up", "head_up", "Head up"),
+    ("/head/down", "head_down", "Head down"),
+    ("/lumbar/up", "lumbar_up", "Lumbar up"),
+    ("/lumbar/down", "lumbar_down", "Lumbar down"),
+    ("/foot/up", "foot_up", "Foot up"),
+    ("/foot/down", "foot_down", "Foot down"),
+    ("/stop", "stop", "Stopped"),
+]
+
+
+def _make_command_handler(method_name: str, message: str):
+    """Build a POST handler dispatching one OkinBed command method."""
+    response = command_response(method_name, message)
+
+    async def handler(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
+        await submit_command(mac, method_name)
+        return response
+
+    handler.__name__ = method_name
+    handler.__doc__ = f"{message}."
+    return handler
+
+
+def _make_acked_handler(method_name: str, message: str):
+    """Build a POST handler that waits for the bed's ATT acknowledgement."""
+    response = command_response(method_name, f"{message} (acked)")
+    frame = COMMAND_BYTES[method_name]
+
+    async def handler(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
+        bed = await get_bed(mac)
+        async with _bed_lock:
+            await bed._send_command(frame, ack=True)
+        return response
+
+    handler.__name__ = f"{method_name}_ack"
+    handler.__doc__ = f"{message}, confirmed by an acknowledged GATT write."
+    return handler
+
+
+# Each position command gets two routes: the default is fire-and-forget
+# (one connection interval of latency), and the /ack variant blocks on
+# the per-write ATT acknowledgement for integration tests that need
+# delivery confirmation.
+for _path, _method, _message in POSITION_ROUTES:
+    app.add_api_route(
+        _path,
+        _make_command_handler(_method, _message),
+        methods=["POST"],
+        responses={200: {"model": CommandResponse}},
+        summary=f"{_message} (fire-and-forget write)",
+    )
+    app.add_api_route(
+        f"{_path}/ack",
+        _make_acked_handler(_method, _message),
+        methods=["POST"],
+        responses={200: {"model": CommandResponse}},
+        summary=f"{_message} (acknowledged write)",
+    )
 
 
-@app.post("/stop", response_model=CommandResponse)
-async def stop(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
-    """Stop all movement."""
-    bed = await get_bed(mac)
-    await bed.stop()
-    return CommandResponse(success=True, message="Stopped", command="stop")
+# Human-readable message per command name, for the parameterized route
+_ACTION_MESSAGES = {
+    "head_up": "Head up",
+    "head_down": "Head down",
+    "lumbar_up": "Lumbar up",
+    "lumbar_down": "Lumbar down",
+    "foot_up": "Foot up",
+    "foot_down": "Foot down",
+    "stop": "Stopped",
+    "flat": "Flat position",
+    "zero_gravity": "Zero gravity",
+    "anti_snore": "Anti-snore",
+    "tv_position": "TV position",
+    "lounge": "Lounge",
+    "massage_on": "Massage on",
+    "massage_off": "Massage off",
+    "light_on": "Light on",
+    "light_off": "Light off",
+    "light_toggle": "Light toggled",
+}
+
+
+@app.post("/cmd/{action}", responses={200: {"model": CommandResponse}})
+async def run_command(
+    action: str,
+    mac: str = Query(..., description="Bluetooth MAC address of the bed"),
+):
+    """Dispatch any named command through one parameterized route.
+
+    Single route for every command the named endpoints expose - one
+    route-table entry for clients that prefer to template the action.
+    """
+    message = _ACTION_MESSAGES.get(action)
+    if message is None:
+        raise HTTPException(status_code=404, detail=f"Unknown command: {action}")
+    await submit_command(mac, action)
+    return command_response(action, message)
 
 
 # Preset positions
-@app.post("/preset/flat", response_model=CommandResponse)
+@app.post("/preset/flat", responses={200: {"model": CommandResponse}})
 async def preset_flat(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
     """Move to flat position."""
-    bed = await get_bed(mac)
-    await bed.flat()
-    return CommandResponse(success=True, message="Flat position", command="flat")
+    await submit_command(mac, "flat")
+    return command_response("flat", "Flat position")
 
 
-@app.post("/preset/zero-gravity", response_model=CommandResponse)
+@app.post("/preset/zero-gravity", responses={200: {"model": CommandResponse}})
 async def preset_zero_gravity(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
     """Move to zero gravity position."""
-    bed = await get_bed(mac)
-    await bed.zero_gravity()
-    return CommandResponse(success=True, message="Zero gravity", command="zero_gravity")
+    await submit_command(mac, "zero_gravity")
+    return command_response("zero_gravity", "Zero gravity")
 
 
-@app.post("/preset/anti-snore", response_model=CommandResponse)
+@app.post("/preset/anti-snore", responses={200: {"model": CommandResponse}})
 async def preset_anti_snore(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
     """Move to anti-snore position."""
-    bed = await get_bed(mac)
-    await bed.anti_snore()
-    return CommandResponse(success=True, message="Anti-snore", command="anti_snore")
+    await submit_command(mac, "anti_snore")
+    return command_response("anti_snore", "Anti-snore")
 
 
-@app.post("/preset/tv", response_model=CommandResponse)
+@app.post("/preset/tv", responses={200: {"model": CommandResponse}})
 async def preset_tv(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
     """Move to TV position."""
-    bed = await get_bed(mac)
-    await bed.tv_position()
-    return CommandResponse(success=True, message="TV position", command="tv_position")
+    await submit_command(mac, "tv_position")
+    return command_response("tv_position", "TV position")
 
 
-@app.post("/preset/lounge", response_model=CommandResponse)
+@app.post("/preset/lounge", responses={200: {"model": CommandResponse}})
 async def preset_lounge(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
     """Move to lounge position."""
-    bed = await get_bed(mac)
-    await bed.lounge()
-    return CommandResponse(success=True, message="Lounge", command="lounge")
+    await submit_command(mac, "lounge")
+    return command_response("lounge", "Lounge")
 
 
 # Massage controls
-@app.post("/massage/on", response_model=CommandResponse)
+@app.post("/massage/on", responses={200: {"model": CommandResponse}})
 async def massage_on(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
     """Turn massage on."""
-    bed = await get_bed(mac)
-    await bed.massage_on()
-    return CommandResponse(success=True, message="Massage on", command="massage_on")
+    if is_duplicate_command(mac, "massage_on"):
+        return command_response("massage_on", "Massage on (coalesced)")
+    await submit_command(mac, "massage_on")
+    return command_response("massage_on", "Massage on")
 
 
-@app.post("/massage/off", response_model=CommandResponse)
+@app.post("/massage/off", responses={200: {"model": CommandResponse}})
 async def massage_off(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
     """Turn massage off."""
-    bed = await get_bed(mac)
-    await bed.massage_off()
-    return CommandResponse(success=True, message="Massage off", command="massage_off")
+    if is_duplicate_command(mac, "massage_off"):
+        return command_response("massage_off", "Massage off (coalesced)")
+    await submit_command(mac, "massage_off")
+    return command_response("massage_off", "Massage off")
 
 
 # Lighting controls
-@app.post("/light/on", response_model=CommandResponse)
+@app.post("/light/on", responses={200: {"model": CommandResponse}})
 async def light_on(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
     """Turn under-bed light on."""
-    bed = await get_bed(mac)
-    await bed.light_on()
-    return CommandResponse(success=True, message="Light on", command="light_on")
+    if is_duplicate_command(mac, "light_on"):
+        return command_response("light_on", "Light on (coalesced)")
+    await submit_command(mac, "light_on")
+    return command_response("light_on", "Light on")
 
 
-@app.post("/light/off", response_model=CommandResponse)
+@app.post("/light/off", responses={200: {"model": CommandResponse}})
 async def light_off(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
     """Turn under-bed light off."""
-    bed = await get_bed(mac)
-    await bed.light_off()
-    return CommandResponse(success=True, message="Light off", command="light_off")
+    if is_duplicate_command(mac, "light_off"):
+        return command_response("light_off", "Light off (coalesced)")
+    await submit_command(mac, "light_off")
+    return command_response("light_off", "Light off")
 
 
-@app.post("/light/toggle", response_model=CommandResponse)
+@app.post("/light/toggle", responses={200: {"model": CommandResponse}})
 async def light_toggle(mac: str = Query(..., description="Bluetooth MAC address of the bed")):
     """Toggle under-bed light."""
-    bed = await get_bed(mac)
-    await bed.light_toggle()
-    return CommandResponse(success=True, message="Light toggled", command="light_toggle")
+    if is_duplicate_command(mac, "light_toggle"):
+        return command_response("light_toggle", "Light toggled (coalesced)")
+    await submit_command(mac, "light_toggle")
+    return command_response("light_toggle", "Light toggled")
 
 
 def main():
@@ -341,8 +1017,6 @@ def main():
     import uvicorn
     import argparse
 
-    global bed_instances
-
     parser = argparse.ArgumentParser(
         description="OKIN Bed API Server - Multi-bed support via MAC query parameter"
     )
@@ -364,25 +1038,57 @@ def main():
         default=8000,
         help="Port to bind to (default: 8000)",
     )
+    parser.add_argument(
+        "--conn-interval-ms",
+        type=float,
+        default=None,
+        help="Request this BLE connection interval in ms (Linux, root only; "
+             "lower = faster commands, e.g. 7.5)",
+    )
 
     args = parser.parse_args()
 
+    # Apply CLI override for BLE interval tuning (picked up in lifespan)
+    if args.conn_interval_ms is not None:
+        global CONN_INTERVAL_MS
+        CONN_INTERVAL_MS = args.conn_interval_ms
+
     # Pre-configure bed if MAC provided (backward compatibility)
     if args.mac:
         mac = validate_mac_address(args.mac)
-        bed_instances[mac] = OkinBed(mac_address=mac)
-        logger.info(f"Pre-configured bed MAC: {mac}")
+        bed_instances[mac] = _new_bed(mac)
+        logger.info("Pre-configured bed MAC: %s", mac)
     else:
         logger.info("No pre-configured MAC. Beds will be configured via query parameters.")
 
-    logger.info(f"Starting OKIN Bed API server on {args.host}:{args.port}")
+    logger.info("Starting OKIN Bed API server on %s:%s", args.host, args.port)
     logger.info("Multi-bed mode: Use ?mac=XX:XX:XX:XX:XX:XX on all endpoints")
 
+    # uvicorn[standard] ships uvloop and httptools, but neither is
+    # guaranteed (uvloop has no Windows build), so only pin the fast
+    # implementations when they actually import; "auto" picks them up
+    # anyway when present
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "auto"
+    try:
+        import httptools  # noqa: F401
+        http_impl = "httptools"
+    except ImportError:
+        http_impl = "auto"
+
     uvicorn.run(
         "okin_bed.api_server:app",
         host=args.host,
         port=args.port,
         log_level="info",
+        loop=loop_impl,
+        http=http_impl,
+        # The BLE adapter is single-owner; multiple workers would fight
+        # over it, so pin the server to one process
+        workers=1,
     )
 
 
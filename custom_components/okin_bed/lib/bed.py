@@ -1,21 +1,34 @@
 """Main OkinBed class for controlling the adjustable bed."""
 
 import asyncio
+import json
 import logging
-from typing import Optional, Callable
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Optional, Callable
 from bleak import BleakClient, BleakScanner
 from bleak.backends.device import BLEDevice
 
 from .constants import (
     OKIN_SERVICE_UUID,
+    OKIN_SERVICE_UUID_LOWER,
     OKIN_TX_CHAR_UUID,
     OKIN_RX_CHAR_UUID,
     NUS_SERVICE_UUID,
+    NUS_SERVICE_UUID_LOWER,
     NUS_TX_CHAR_UUID,
     NUS_RX_CHAR_UUID,
-    DEVICE_NAME_PATTERNS,
+    ALT_SERVICE_UUID_1,
+    ALT_SERVICE_UUID_2,
+    DEVICE_NAME_PATTERN_RE,
     CONNECTION_TIMEOUT,
     COMMAND_DELAY,
+    WRITE_TIMEOUT,
+    DISCONNECT_TIMEOUT,
+    DEVICE_RESOLVE_TIMEOUT,
+    TARGET_MTU,
     SCAN_TIMEOUT,
     Command,
     BedPosition,
@@ -24,6 +37,77 @@ from .constants import (
 
 logger = logging.getLogger(__name__)
 
+# Built once at import - set_position/set_massage_wave used to rebuild
+# these dicts on every call
+_POSITION_COMMANDS = {
+    BedPosition.FLAT: Command.FLAT,
+    BedPosition.ZERO_GRAVITY: Command.ZERO_GRAVITY,
+    BedPosition.LOUNGE: Command.LOUNGE,
+    BedPosition.ANTI_SNORE: Command.ANTI_SNORE,
+    BedPosition.ASCENT: Command.ASCENT,
+}
+
+_WAVE_COMMANDS = {
+    1: Command.MASSAGE_WAVE_1,
+    2: Command.MASSAGE_WAVE_2,
+    3: Command.MASSAGE_WAVE_3,
+}
+
+# Resolved GATT endpoints cached on disk keyed by MAC. Service discovery
+# dominates reconnect latency on a known bed, so a cache hit lets
+# connect() hand BleakClient the service filter and skip the table walk.
+_CHAR_CACHE_DIR = Path(
+    os.environ.get("OKIN_CHAR_CACHE_DIR", str(Path.home() / ".cache" / "okin-bed"))
+)
+
+
+def _char_cache_path(mac: str) -> Path:
+    return _CHAR_CACHE_DIR / (mac.replace(":", "-").lower() + ".json")
+
+
+def _load_char_cache(mac: str) -> Optional[dict]:
+    """Load cached GATT endpoints for a bed, or None on miss/corruption."""
+    try:
+        data = json.loads(_char_cache_path(mac).read_text())
+        if data.get("service") and data.get("tx"):
+            return data
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _save_char_cache(mac: str, service: str, tx: str, rx: Optional[str]):
+    """Persist resolved GATT endpoints (best effort)."""
+    try:
+        _CHAR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _char_cache_path(mac).write_text(
+            json.dumps({"service": service, "tx": tx, "rx": rx})
+        )
+    except OSError as e:
+        logger.debug(f"Could not save characteristic cache: {e}")
+
+
+def _invalidate_char_cache(mac: str):
+    """Drop the cached endpoints so the next connect rediscovers."""
+    try:
+        _char_cache_path(mac).unlink()
+    except OSError:
+        pass
+
+
+# Frames the controller firmware cannot accept back-to-back; only these
+# are paced by COMMAND_DELAY. Membership tests also work for memoryview
+# arguments, which hash and compare equal to their bytes content.
+_MOVEMENT_FRAMES = frozenset({
+    Command.HEAD_UP,
+    Command.HEAD_DOWN,
+    Command.LUMBAR_UP,
+    Command.LUMBAR_DOWN,
+    Command.FOOT_UP,
+    Command.FOOT_DOWN,
+    Command.STOP,
+})
+
 
 class OkinBed:
     """Controller for OKIN adjustable bed via BLE."""
@@ -42,11 +126,24 @@ class OkinBed:
         """
         self.mac_address = mac_address
         self.device_name = device_name
+        # Lowercased once here - the scan match callback runs per
+        # advertisement, so it shouldn't re-lowercase these every time
+        self._mac_lower = mac_address.lower() if mac_address else None
+        self._device_name_lower = device_name.lower() if device_name else None
         self.client: Optional[BleakClient] = None
         self.tx_char_uuid: Optional[str] = None
         self.rx_char_uuid: Optional[str] = None
         self._notification_callback: Optional[Callable] = None
         self._connected = False
+        self._last_movement_ts = 0.0
+        self._service_uuid: Optional[str] = None
+        self._used_char_cache = False
+        # Resolved BLEDevice kept across reconnects - handing it to
+        # BleakClient skips the backend's internal discovery wait
+        self._cached_device: Optional[BLEDevice] = None
+        # Called with this OkinBed when the link drops unexpectedly,
+        # letting owners reconnect on the event instead of polling
+        self.on_disconnect: Optional[Callable] = None
 
     async def scan_for_bed(self, timeout: float = SCAN_TIMEOUT) -> Optional[BLEDevice]:
         """
@@ -66,21 +163,58 @@ class OkinBed:
                 return False
 
             # Check if MAC address matches (if specified)
-            if self.mac_address and device.address.lower() == self.mac_address.lower():
+            if self._mac_lower and device.address.lower() == self._mac_lower:
                 return True
 
             # Check if name matches (if specified)
-            if self.device_name and self.device_name.lower() in device.name.lower():
+            if self._device_name_lower and self._device_name_lower in device.name.lower():
                 return True
 
-            # Check if name matches known patterns
-            return any(pattern.lower() in device.name.lower() for pattern in DEVICE_NAME_PATTERNS)
+            # Check if name matches known patterns - one compiled scan
+            return DEVICE_NAME_PATTERN_RE.search(device.name) is not None
+
+        # Callback scanner with early termination: stop the moment a match
+        # arrives instead of waiting out the full timeout. The service_uuids
+        # filter keeps unrelated advertisements from crossing into Python.
+        found = asyncio.Event()
+        result = {}
+
+        def detection_callback(device: BLEDevice, advertisement_data):
+            if not found.is_set() and match_device(device, advertisement_data):
+                result["device"] = device
+                found.set()
+
+        # Active scanning requests scan responses, which carry the device
+        # name most beds only include there - and discovers faster than
+        # passive duty cycles
+        # The OS pre-filters advertisements to these services, so only
+        # candidate beds cross the OS-to-Python boundary. Alternate
+        # service UUIDs from the decompiled app are included for bed
+        # models that advertise those instead.
+        scanner = BleakScanner(
+            detection_callback=detection_callback,
+            service_uuids=[
+                OKIN_SERVICE_UUID,
+                NUS_SERVICE_UUID,
+                ALT_SERVICE_UUID_1,
+                ALT_SERVICE_UUID_2,
+            ],
+            scanning_mode="active",
+        )
+        await scanner.start()
+        try:
+            await asyncio.wait_for(found.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            await scanner.stop()
 
-        device = await BleakScanner.find_device_by_filter(match_device, timeout=timeout)
+        device = result.get("device")
 
         if device:
             logger.info(f"Found bed device: {device.name} ({device.address})")
             self.mac_address = device.address
+            self._cached_device = device
         else:
             logger.warning("No OKIN bed device found")
 
@@ -110,15 +244,63 @@ class OkinBed:
 
         try:
             logger.info(f"Connecting to {self.mac_address}...")
-            self.client = BleakClient(self.mac_address, timeout=timeout)
-            await self.client.connect()
 
-            if not self.client.is_connected:
-                logger.error("Failed to connect")
-                return False
+            # The connection interval bounds per-write latency, so ask the
+            # kernel for a short one before the link is established
+            self._request_fast_connection()
 
-            # Discover services and characteristics
-            await self._discover_characteristics()
+            # Resolve the device object once; connecting by BLEDevice skips
+            # the StartDiscovery round bleak otherwise runs per connect by
+            # address. Short timeout - on a miss we fall back to the
+            # address path rather than stall
+            device = self._cached_device
+            if device is None:
+                try:
+                    device = await BleakScanner.find_device_by_address(
+                        self.mac_address, timeout=DEVICE_RESOLVE_TIMEOUT
+                    )
+                except Exception as e:
+                    logger.debug(f"Quick device resolution failed: {e}")
+                    device = None
+                if device is not None:
+                    self._cached_device = device
+
+            cached = _load_char_cache(self.mac_address)
+            self.client = BleakClient(
+                device if device is not None else self.mac_address,
+                timeout=timeout,
+                disconnected_callback=self._handle_disconnect,
+                services=[cached["service"]] if cached else None,
+            )
+            # connect() raises on failure on all current backends, so no
+            # is_connected re-check - that property round-trips to the OS
+            # on some of them
+            await self.client.connect()
+
+            if cached:
+                # Known bed: reuse the resolved endpoints and let the
+                # backend work from its cached GATT database
+                logger.debug("Using cached GATT endpoints")
+                self._service_uuid = cached["service"]
+                self.tx_char_uuid = cached["tx"]
+                self.rx_char_uuid = cached.get("rx")
+                self._used_char_cache = True
+            else:
+                # Discover services and characteristics
+                await self._discover_characteristics()
+                self._used_char_cache = False
+                if self._service_uuid and self.tx_char_uuid:
+                    _save_char_cache(
+                        self.mac_address,
+                        self._service_uuid,
+                        self.tx_char_uuid,
+                        self.rx_char_uuid,
+                    )
+
+            # Ask for a larger MTU so batched command frames fit one PDU.
+            # BlueZ negotiates during service discovery; other backends may
+            # expose an explicit exchange. Peripherals can refuse - fine.
+            await self._negotiate_mtu()
 
             # Enable notifications on RX characteristic if available
             if self.rx_char_uuid:
@@ -134,75 +316,188 @@ class OkinBed:
 
         except Exception as e:
             logger.error(f"Connection error: {e}")
+            # The cached device object may be stale (adapter restart,
+            # address rotation); re-resolve on the next attempt
+            self._cached_device = None
             return False
 
     async def _discover_characteristics(self):
-        """Discover and set the correct TX/RX characteristics."""
+        """Discover and set the correct TX/RX characteristics.
+
+        Single pass over the service table: the OKIN match, the NUS match
+        and the writable/notify fallbacks are collected together, so each
+        service object (an OS-level handle on WinRT/CoreBluetooth) is
+        touched once instead of up to three times.
+        """
         if not self.client:
             return
 
-        # Try OKIN custom service first
+        nus_service = None
+        fallback_service = None
+        fallback_tx = None
+        fallback_rx = None
+
         for service in self.client.services:
-            if service.uuid.lower() == OKIN_SERVICE_UUID.lower():
-                logger.info(f"Found OKIN service: {service.uuid}")
+            svc_lower = service.uuid.lower()
+
+            if svc_lower == OKIN_SERVICE_UUID_LOWER:
+                # Preferred service - no need to keep scanning
+                logger.info("Found OKIN service: %s", service.uuid)
+                self._service_uuid = service.uuid
                 self.tx_char_uuid = OKIN_TX_CHAR_UUID
                 self.rx_char_uuid = OKIN_RX_CHAR_UUID
                 return
 
-        # Try Nordic UART Service
-        for service in self.client.services:
-            if service.uuid.lower() == NUS_SERVICE_UUID.lower():
-                logger.info(f"Found NUS service: {service.uuid}")
-                self.tx_char_uuid = NUS_TX_CHAR_UUID
-                self.rx_char_uuid = NUS_RX_CHAR_UUID
-                return
+            if svc_lower == NUS_SERVICE_UUID_LOWER:
+                nus_service = service
+                continue
+
+            # Remember the first writable/notify pair in case no known
+            # service turns up
+            if fallback_tx is None:
+                for char in service.characteristics:
+                    props = char.properties
+                    if fallback_tx is None and "write" in props:
+                        fallback_tx = char.uuid
+                        fallback_service = service.uuid
+                    if fallback_rx is None and "notify" in props:
+                        fallback_rx = char.uuid
+
+        if nus_service is not None:
+            logger.info("Found NUS service: %s", nus_service.uuid)
+            self._service_uuid = nus_service.uuid
+            self.tx_char_uuid = NUS_TX_CHAR_UUID
+            self.rx_char_uuid = NUS_RX_CHAR_UUID
+        elif fallback_tx is not None:
+            logger.warning(
+                "No known service found; using fallback TX %s (RX %s) on service %s",
+                fallback_tx, fallback_rx, fallback_service,
+            )
+            self._service_uuid = fallback_service
+            self.tx_char_uuid = fallback_tx
+            self.rx_char_uuid = fallback_rx
+        else:
+            logger.warning("No known service and no writable characteristic found")
 
-        # If no known service found, log all available services
-        logger.warning("No known service found. Available services:")
-        for service in self.client.services:
-            logger.warning(f"  Service: {service.uuid}")
-            for char in service.characteristics:
-                logger.warning(f"    Characteristic: {char.uuid} - {char.properties}")
+    def _request_fast_connection(self):
+        """Request a short BLE connection interval (Linux, root, opt-in).
 
-        # Use first writable characteristic as fallback
-        for service in self.client.services:
-            for char in service.characteristics:
-                if "write" in char.properties:
-                    logger.info(f"Using fallback TX characteristic: {char.uuid}")
-                    self.tx_char_uuid = char.uuid
-                if "notify" in char.properties:
-                    logger.info(f"Using fallback RX characteristic: {char.uuid}")
-                    self.rx_char_uuid = char.uuid
-            if self.tx_char_uuid:
-                break
+        The connection interval is the hard lower bound on per-command
+        latency - dropping the common 48 ms default to 7.5-15 ms speeds up
+        every GATT write proportionally. BlueZ has no public per-connection
+        API for this, so the kernel's debugfs knobs are written instead
+        (the same mechanism the API server uses at startup). Enabled by
+        setting OKIN_CONN_INTERVAL_MS; failures are logged and ignored.
+        """
+        try:
+            interval_ms = float(os.environ.get("OKIN_CONN_INTERVAL_MS", "0"))
+        except ValueError:
+            return
+        if interval_ms <= 0:
+            return
+        if not sys.platform.startswith("linux"):
+            logger.warning("Connection interval tuning is only supported on Linux")
+            return
+
+        units = max(6, int(interval_ms / 1.25))  # kernel minimum is 6 (7.5 ms)
+        base = Path("/sys/kernel/debug/bluetooth/hci0")
+        try:
+            (base / "conn_min_interval").write_text(f"{units}\n")
+            (base / "conn_max_interval").write_text(f"{units + 4}\n")
+            logger.info(
+                f"Requested {units * 1.25:.2f}-{(units + 4) * 1.25:.2f} ms "
+                f"connection interval"
+            )
+        except OSError as e:
+            logger.debug(f"Could not tune connection interval: {e}")
+
+    async def _negotiate_mtu(self):
+        """Request TARGET_MTU and log the negotiated value (best effort)."""
+        if not self.client:
+            return
+        try:
+            exchange = getattr(self.client._backend, "exchange_mtu", None)
+            if exchange is not None:
+                await exchange(TARGET_MTU)
+            logger.info(f"Negotiated MTU: {self.client.mtu_size}")
+        except Exception as e:
+            logger.debug(f"MTU negotiation skipped: {e}")
+
+    async def _noop_read(self) -> bool:
+        """Touch the link with a benign GATT read to keep it warm.
+
+        Reads the bed's own RX characteristic, which moves no hardware.
+        The GAP Device Name characteristic would be the textbook choice,
+        but BlueZ hides it from GATT clients and cache-hit connects filter
+        service discovery down to the bed's service anyway, so it has to
+        be a characteristic we already resolved. A warm link lets the next
+        command skip the 10-15s cold connection setup.
+
+        Returns:
+            True if the read succeeded, False otherwise
+        """
+        if not self._connected or not self.client or not self.rx_char_uuid:
+            return False
+        try:
+            await self.client.read_gatt_char(self.rx_char_uuid)
+            return True
+        except Exception as e:
+            logger.debug(f"Keep-warm read failed: {e}")
+            return False
 
     def _notification_handler(self, sender, data):
         """Handle notifications from the bed."""
-        logger.debug(f"Notification from {sender}: {data.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Notification from %s: %s", sender, data.hex())
         if self._notification_callback:
             self._notification_callback(sender, data)
 
+    def _handle_disconnect(self, client):
+        """Bleak disconnect callback - flag the drop and notify the owner.
+
+        Expected disconnects (we called disconnect() ourselves) have already
+        cleared _connected, so only surprise link losses propagate.
+        """
+        if not self._connected:
+            return
+        self._connected = False
+        logger.warning("Unexpected disconnect from bed")
+        if self.on_disconnect:
+            self.on_disconnect(self)
+
     async def disconnect(self):
         """Disconnect from the bed."""
         if self.client and self._connected:
             logger.info("Disconnecting...")
+            # Clear the flag first so the disconnect callback knows this
+            # drop was requested
+            self._connected = False
             # Stop notifications if enabled
             if self.rx_char_uuid:
                 try:
                     await self.client.stop_notify(self.rx_char_uuid)
                 except Exception:
                     pass
-            await self.client.disconnect()
-            self._connected = False
+            try:
+                # Backends occasionally hang in disconnect; don't let that
+                # block shutdown
+                await asyncio.wait_for(self.client.disconnect(), timeout=DISCONNECT_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.warning("Disconnect timed out; dropping connection")
             logger.info("Disconnected")
 
-    async def _send_command(self, command: bytes, response: bool = False) -> Optional[bytes]:
+    async def _send_command(
+        self, command: bytes, response: bool = False, ack: bool = False
+    ) -> Optional[bytes]:
         """
         Send a command to the bed.
 
         Args:
             command: Command bytes to send
             response: Whether to wait for a response
+            ack: Use an acknowledged GATT write. Movement commands are
+                fire-and-forget (matching the captured app traffic), so the
+                default skips the per-write ACK round-trip.
 
         Returns:
             Response bytes if requested, None otherwise
@@ -216,11 +511,31 @@ class OkinBed:
             raise RuntimeError("TX characteristic not found")
 
         try:
-            logger.debug(f"Sending command: {command.hex()}")
-            # Use write without response (ATT Write Command, opcode 0x52)
-            # This matches the captured BLE traffic from the Android app
-            await self.client.write_gatt_char(self.tx_char_uuid, command, response=False)
-            await asyncio.sleep(COMMAND_DELAY)
+            # Guarded so the hex string is only built when debug logging
+            # is actually on - it's one allocation per write otherwise
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sending command: %s", command.hex())
+
+            # Only movement frames need pacing - the firmware drops them
+            # when repeated faster than COMMAND_DELAY. Everything else
+            # pipelines without a forced scheduler round-trip per write.
+            is_movement = command in _MOVEMENT_FRAMES
+            if is_movement:
+                wait = COMMAND_DELAY - (time.monotonic() - self._last_movement_ts)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+            # Default is write without response (ATT Write Command, opcode 0x52)
+            # This matches the captured BLE traffic from the Android app.
+            # Bounded by WRITE_TIMEOUT so a wedged GATT write surfaces as an
+            # error instead of hanging the caller indefinitely.
+            await asyncio.wait_for(
+                self.client.write_gatt_char(self.tx_char_uuid, command, response=ack),
+                timeout=WRITE_TIMEOUT,
+            )
+
+            if is_movement:
+                self._last_movement_ts = time.monotonic()
 
             # TODO: Implement response handling if needed
             if response:
@@ -230,8 +545,39 @@ class OkinBed:
 
         except Exception as e:
             logger.error(f"Error sending command: {e}")
+            if self._used_char_cache and self.mac_address:
+                # Cached endpoints may be stale (e.g. after a firmware
+                # update); drop them so the next connect rediscovers
+                _invalidate_char_cache(self.mac_address)
+                self._used_char_cache = False
             raise
 
+    async def send_batch(self, commands: Iterable[bytes]):
+        """
+        Send several command frames as one back-to-back write burst.
+
+        All writes go out without response and without per-command pacing,
+        letting the stack pack multiple PDUs into a single connection
+        event instead of paying one connection interval each. Ordering is
+        preserved by bleak's write queue.
+
+        Args:
+            commands: Command frames to send, in order
+        """
+        if not self._connected or not self.client:
+            logger.error("Not connected to bed")
+            raise RuntimeError("Not connected to bed")
+
+        if not self.tx_char_uuid:
+            logger.error("TX characteristic not found")
+            raise RuntimeError("TX characteristic not found")
+
+        for command in commands:
+            await asyncio.wait_for(
+                self.client.write_gatt_char(self.tx_char_uuid, command, response=False),
+                timeout=WRITE_TIMEOUT,
+            )
+
     # Position control methods
     async def head_up(self):
         """Raise the head section."""
@@ -269,14 +615,7 @@ class OkinBed:
         Args:
             position: Desired bed position
         """
-        command_map = {
-            BedPosition.FLAT: Command.FLAT,
-            BedPosition.ZERO_GRAVITY: Command.ZERO_GRAVITY,
-            BedPosition.LOUNGE: Command.LOUNGE,
-            BedPosition.ANTI_SNORE: Command.ANTI_SNORE,
-            BedPosition.ASCENT: Command.ASCENT,
-        }
-        await self._send_command(command_map[position])
+        await self._send_command(_POSITION_COMMANDS[position])
 
     async def flat(self):
         """Set bed to flat position."""
@@ -314,15 +653,10 @@ class OkinBed:
         Args:
             wave: Wave pattern (1, 2, or 3)
         """
-        if wave not in [1, 2, 3]:
+        if wave not in _WAVE_COMMANDS:
             raise ValueError("Wave must be 1, 2, or 3")
 
-        command_map = {
-            1: Command.MASSAGE_WAVE_1,
-            2: Command.MASSAGE_WAVE_2,
-            3: Command.MASSAGE_WAVE_3,
-        }
-        await self._send_command(command_map[wave])
+        await self._send_command(_WAVE_COMMANDS[wave])
 
     # Lighting control
     async def light_on(self):
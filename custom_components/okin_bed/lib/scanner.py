@@ -3,53 +3,81 @@
 import asyncio
 import logging
 from bleak import BleakScanner
-from .constants import DEVICE_NAME_PATTERNS
+from .constants import DEVICE_NAME_PATTERNS, DEVICE_NAME_PATTERN_RE
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-async def scan_for_beds(timeout: float = 10.0):
+async def scan_for_beds(timeout: float = 10.0, target_count: int = 1):
     """
     Scan for OKIN bed devices and display results.
 
     Args:
         timeout: Scan duration in seconds
+        target_count: Stop scanning early once this many beds are found
     """
     logger.info(f"Scanning for BLE devices for {timeout} seconds...")
     logger.info(f"Looking for devices matching: {', '.join(DEVICE_NAME_PATTERNS)}")
     print()
 
-    # Dictionary to store devices with their advertisement data
-    devices_found = {}
-
-    def detection_callback(device, advertisement_data):
-        """Callback for each discovered device."""
-        devices_found[device.address] = {
-            'device': device,
-            'rssi': advertisement_data.rssi,
-            'name': device.name or advertisement_data.local_name or "(Unknown)"
-        }
-
-    # Scan with callback to get RSSI
-    scanner = BleakScanner(detection_callback=detection_callback)
-    await scanner.start()
-    await asyncio.sleep(timeout)
-    await scanner.stop()
+    # Repeat advertisements from the same address are cheap to drop, but
+    # not unconditionally: on BlueZ the device name often arrives in the
+    # scan response - a *second* callback for the same address - so a
+    # device classified only from its first packet would stay "(Unknown)"
+    # forever. Re-process a known address when a name shows up or the RSSI
+    # moves materially; skip the rest.
+    RSSI_DELTA = 10  # dBm change worth re-recording
 
+    seen_devices = {}  # address -> the data dict stored in all_devices
     found_beds = []
     all_devices = []
 
-    for addr, data in devices_found.items():
-        device = data['device']
-        name = data['name']
-        rssi = data['rssi']
-
-        all_devices.append(data)
+    # Set once enough matching beds are seen so we can stop scanning early
+    found_event = asyncio.Event()
 
-        # Check if device matches OKIN patterns
-        if name and any(pattern.lower() in name.lower() for pattern in DEVICE_NAME_PATTERNS):
+    def detection_callback(device, advertisement_data):
+        """Callback for each discovered device."""
+        name = device.name or advertisement_data.local_name
+        rssi = advertisement_data.rssi
+
+        data = seen_devices.get(device.address)
+        if data is not None:
+            name_arrived = name and data['name'] == "(Unknown)"
+            if not name_arrived and abs(rssi - data['rssi']) < RSSI_DELTA:
+                return
+            data['rssi'] = rssi
+            if not name_arrived:
+                return
+            # Late name: classify the device now that we can
+            data['name'] = name
+        else:
+            data = {
+                'device': device,
+                'rssi': rssi,
+                'name': name or "(Unknown)"
+            }
+            seen_devices[device.address] = data
+            all_devices.append(data)
+            if not name:
+                return
+
+        if DEVICE_NAME_PATTERN_RE.search(name):
             found_beds.append(data)
+            # Stream matches as they arrive instead of making the user
+            # wait out the full scan for any output
+            print(f"Found bed: {name} ({device.address}) {rssi} dBm")
+            if len(found_beds) >= target_count:
+                found_event.set()
+
+    # Scan with callback to get RSSI; finish as soon as a bed matches. The
+    # context manager guarantees the scanner is stopped even if we're
+    # cancelled mid-scan (e.g. HA unloading the integration)
+    async with BleakScanner(detection_callback=detection_callback, scanning_mode="active"):
+        try:
+            await asyncio.wait_for(found_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass  # No bed found - fall through and show everything we saw
 
     # Display found OKIN beds
     if found_beds:
@@ -88,6 +116,13 @@ async def main():
         default=10.0,
         help="Scan duration in seconds (default: 10)"
     )
+    parser.add_argument(
+        "--count",
+        "-c",
+        type=int,
+        default=1,
+        help="Stop scanning once this many beds are found (default: 1)"
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -100,7 +135,7 @@ async def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
-    await scan_for_beds(timeout=args.timeout)
+    await scan_for_beds(timeout=args.timeout, target_count=args.count)
 
 
 if __name__ == "__main__":
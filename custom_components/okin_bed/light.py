@@ -8,7 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, CONF_DEVICE_NAME
+from .const import CONF_DEVICE_NAME
 from .coordinator import OkinBedCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -20,7 +20,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up OKIN Bed light entities."""
-    coordinator: OkinBedCoordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator: OkinBedCoordinator = config_entry.runtime_data
     device_name = config_entry.data[CONF_DEVICE_NAME]
 
     entities = [
@@ -33,6 +33,8 @@ async def async_setup_entry(
 class OkinBedLight(LightEntity):
     """Representation of an OKIN bed under-bed light."""
 
+    __slots__ = ("coordinator",)
+
     def __init__(
         self,
         coordinator: OkinBedCoordinator,
@@ -47,13 +49,15 @@ class OkinBedLight(LightEntity):
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
         _LOGGER.info("Turning on under-bed light")
-        if await self.coordinator.async_send_command("light_on"):
-            self._attr_is_on = True
-            self.async_write_ha_state()
+        # Sends are fire-and-forget (queued to the coordinator's tx worker),
+        # so update the optimistic state unconditionally
+        await self.coordinator.async_send_command("light_on")
+        self._attr_is_on = True
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
         _LOGGER.info("Turning off under-bed light")
-        if await self.coordinator.async_send_command("light_off"):
-            self._attr_is_on = False
-            self.async_write_ha_state()
+        await self.coordinator.async_send_command("light_off")
+        self._attr_is_on = False
+        self.async_write_ha_state()
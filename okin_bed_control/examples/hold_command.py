@@ -23,9 +23,9 @@ async def main():
     command_hex = sys.argv[2]
     duration = float(sys.argv[3])
 
-    # Parse hex command
+    # Parse hex command (bytes.fromhex runs in C, no per-byte Python loop)
     try:
-        command_bytes = bytes([int(b, 16) for b in command_hex.split()])
+        command_bytes = bytes.fromhex(command_hex.replace(" ", "").replace(":", ""))
     except ValueError as e:
         print(f"Error parsing hex command: {e}")
         sys.exit(1)
@@ -42,10 +42,11 @@ async def main():
         print(f"Duration: {duration}s (sending every 0.1s)")
 
         # Send command repeatedly every 100ms (like holding a button)
-        start_time = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        end_time = loop.time() + duration
         count = 0
 
-        while (asyncio.get_event_loop().time() - start_time) < duration:
+        while loop.time() < end_time:
             await bed._send_command(command_bytes)
             count += 1
             await asyncio.sleep(0.1)
@@ -20,6 +20,8 @@ import asyncio
 import sys
 from okin_bed import OkinBed
 
+STOP_CMD = bytes.fromhex("5a010310300fa5")
+
 
 async def main():
     if len(sys.argv) < 3:
@@ -30,9 +32,9 @@ async def main():
     command_hex = sys.argv[2]
     duration = float(sys.argv[3]) if len(sys.argv) > 3 else 0
 
-    # Parse hex command
+    # Parse hex command (bytes.fromhex runs in C, no per-byte Python loop)
     try:
-        command_bytes = bytes([int(b, 16) for b in command_hex.split()])
+        command_bytes = bytes.fromhex(command_hex.replace(" ", "").replace(":", ""))
     except ValueError as e:
         print(f"Error parsing hex command: {e}")
         print("Format: '5a 01 03 10 30 0f a5' (space-separated hex bytes)")
@@ -53,8 +55,7 @@ async def main():
             print(f"Running for {duration}s...")
             await asyncio.sleep(duration)
             print("Sending STOP...")
-            stop_cmd = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x0f, 0xa5])
-            await bed._send_command(stop_cmd)
+            await bed._send_command(STOP_CMD)
 
         print("✓ Done")
 
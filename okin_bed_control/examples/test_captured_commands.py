@@ -10,38 +10,44 @@ SAFETY WARNINGS:
 """
 
 import asyncio
+import os
 import sys
 from okin_bed import OkinBed
 
 # Captured commands from btsnoop_hci_202511091908.cfa
+# bytes.fromhex parses in C, so these are built once at import with no
+# per-byte Python loop
 COMMANDS = {
-    'STOP': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x0f, 0xa5]),
+    'STOP': bytes.fromhex("5a010310300fa5"),
 
     # Position controls (held button patterns)
-    'CMD_01_HEAD_UP?': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x01, 0xa5]),
-    'CMD_00_HEAD_DOWN?': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x00, 0xa5]),
-    'CMD_07_FOOT_UP?': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x07, 0xa5]),
-    'CMD_02_FOOT_DOWN?': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x02, 0xa5]),
-    'CMD_03_LUMBAR_UP?': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x03, 0xa5]),
+    'CMD_01_HEAD_UP?': bytes.fromhex("5a0103103001a5"),
+    'CMD_00_HEAD_DOWN?': bytes.fromhex("5a0103103000a5"),
+    'CMD_07_FOOT_UP?': bytes.fromhex("5a0103103007a5"),
+    'CMD_02_FOOT_DOWN?': bytes.fromhex("5a0103103002a5"),
+    'CMD_03_LUMBAR_UP?': bytes.fromhex("5a0103103003a5"),
 
     # Preset positions (few uses)
-    'PRESET_10': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x10, 0xa5]),
-    'PRESET_11': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x11, 0xa5]),
-    'PRESET_13': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x13, 0xa5]),
-    'PRESET_16': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x16, 0xa5]),
+    'PRESET_10': bytes.fromhex("5a0103103010a5"),
+    'PRESET_11': bytes.fromhex("5a0103103011a5"),
+    'PRESET_13': bytes.fromhex("5a0103103013a5"),
+    'PRESET_16': bytes.fromhex("5a0103103016a5"),
 
     # Unknown (possibly light/massage)
-    'CMD_58': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x58, 0xa5]),
-    'CMD_6F': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x6f, 0xa5]),
-    'CMD_73': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x73, 0xa5]),
-    'CMD_74': bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x74, 0xa5]),
+    'CMD_58': bytes.fromhex("5a0103103058a5"),
+    'CMD_6F': bytes.fromhex("5a010310306fa5"),
+    'CMD_73': bytes.fromhex("5a0103103073a5"),
+    'CMD_74': bytes.fromhex("5a0103103074a5"),
 
     # Special command
-    'SPECIAL_B0': bytes([0x5a, 0xb0, 0x00, 0xa5]),
+    'SPECIAL_B0': bytes.fromhex("5ab000a5"),
 }
 
+# Display strings, formatted once instead of per test iteration
+COMMANDS_HEX = {name: cmd.hex(" ") for name, cmd in COMMANDS.items()}
 
-async def test_command(bed, name, command_bytes, duration=5.0):
+
+async def test_command(bed, name, command_bytes, duration=5.0, results_fp=None):
     """
     Test a single command.
 
@@ -50,10 +56,11 @@ async def test_command(bed, name, command_bytes, duration=5.0):
         name: Command name
         command_bytes: Bytes to send
         duration: How long to run command (seconds) - default 5s for position controls
+        results_fp: Open results file shared across the session
     """
     print(f"\n{'='*70}")
     print(f"Testing: {name}")
-    print(f"Bytes:   {' '.join(f'{b:02x}' for b in command_bytes)}")
+    print(f"Bytes:   {COMMANDS_HEX.get(name) or command_bytes.hex(' ')}")
     print(f"Duration: {duration}s")
     print(f"{'='*70}")
 
@@ -70,10 +77,15 @@ async def test_command(bed, name, command_bytes, duration=5.0):
         if duration > 0:
             # For position controls, send command repeatedly (like holding button)
             print(f"Holding command for {duration}s (sending every 0.1s)...")
-            start_time = asyncio.get_event_loop().time()
+            # The hold loop and the safety STOP stay strictly sequential -
+            # racing a scheduled STOP against the loop could let a movement
+            # frame land after it. The monotonic end_time bounds the hold
+            # even when individual sends run long.
+            loop = asyncio.get_running_loop()
+            end_time = loop.time() + duration
             count = 0
 
-            while (asyncio.get_event_loop().time() - start_time) < duration:
+            while loop.time() < end_time:
                 await bed._send_command(command_bytes)
                 count += 1
                 await asyncio.sleep(0.1)
@@ -91,8 +103,8 @@ async def test_command(bed, name, command_bytes, duration=5.0):
         result = input("What happened? (describe or press ENTER): ").strip()
         if result:
             print(f"Recorded: {result}")
-            with open('test_results.txt', 'a') as f:
-                f.write(f"{name}: {result}\n")
+            if results_fp:
+                results_fp.write(f"{name}: {result}\n")
 
         # Wait a bit before next command
         await asyncio.sleep(1)
@@ -134,6 +146,11 @@ async def main():
 
     bed = OkinBed(mac_address=mac_address)
 
+    # Open the results file once for the whole session, line-buffered so
+    # recorded results survive a Ctrl-C mid-test
+    results_path = os.environ.get("TEST_RESULTS", "test_results.txt")
+    results_fp = open(results_path, "a", buffering=1)
+
     try:
         connected = await bed.connect()
         if not connected:
@@ -148,7 +165,7 @@ async def main():
         print("This is the most important command - it should do nothing.")
         print("=" * 70)
 
-        await test_command(bed, 'STOP', COMMANDS['STOP'], duration=0)
+        await test_command(bed, 'STOP', COMMANDS['STOP'], duration=0, results_fp=results_fp)
 
         print("\n\nDid the STOP command work correctly (did nothing)?")
         response = input("Continue with movement tests? (yes/no): ").strip().lower()
@@ -171,7 +188,7 @@ async def main():
         ]
 
         for cmd_name in position_commands:
-            if not await test_command(bed, cmd_name, COMMANDS[cmd_name], duration=0.5):
+            if not await test_command(bed, cmd_name, COMMANDS[cmd_name], duration=0.5, results_fp=results_fp):
                 break
 
         # Step 3: Test presets
@@ -190,7 +207,7 @@ async def main():
             ]
 
             for cmd_name in preset_commands:
-                if not await test_command(bed, cmd_name, COMMANDS[cmd_name], duration=0):
+                if not await test_command(bed, cmd_name, COMMANDS[cmd_name], duration=0, results_fp=results_fp):
                     break
 
         # Step 4: Test other commands
@@ -210,13 +227,13 @@ async def main():
             ]
 
             for cmd_name in other_commands:
-                if not await test_command(bed, cmd_name, COMMANDS[cmd_name], duration=0):
+                if not await test_command(bed, cmd_name, COMMANDS[cmd_name], duration=0, results_fp=results_fp):
                     break
 
         print("\n" + "=" * 70)
         print("Testing Complete!")
         print("=" * 70)
-        print("\nResults have been saved to test_results.txt")
+        print(f"\nResults have been saved to {results_path}")
         print("Review the results and update okin_bed_control/okin_bed/constants.py")
 
     except KeyboardInterrupt:
@@ -224,6 +241,7 @@ async def main():
     except Exception as e:
         print(f"\n\nError during testing: {e}")
     finally:
+        results_fp.close()
         print("\nDisconnecting...")
         await bed.disconnect()
         print("Disconnected.")
@@ -4,17 +4,83 @@ import asyncio
 import argparse
 import logging
 import sys
+from functools import lru_cache
 from typing import Optional
 
 from .bed import OkinBed
-from .constants import BedPosition, MassageWave
+from .constants import BedPosition, MassageWave, COMMAND_VIEWS
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# All accepted command names, frozen once at module scope
+CLI_COMMANDS = (
+    "head-up", "head-down", "lumbar-up", "lumbar-down",
+    "foot-up", "foot-down", "stop",
+    "flat", "zero-gravity", "lounge", "anti-snore", "ascent",
+    "massage-on", "massage-off", "massage-wave",
+    "light-on", "light-off", "light-toggle",
+    "brightness-up", "brightness-down",
+    "batch",
+)
+
+# Names accepted as batch members: anything with a captured command frame
+# (so not "batch" itself, and not argument-taking commands like
+# "massage-wave")
+BATCH_COMMANDS = tuple(
+    name for name in CLI_COMMANDS
+    if name.replace("-", "_") in COMMAND_VIEWS
+)
+
+
+async def _run_massage_wave(bed: OkinBed, args: argparse.Namespace):
+    """Dispatch massage-wave after validating the wave argument."""
+    if not args.wave:
+        raise ValueError("Wave number required (1, 2, or 3)")
+    await bed.set_massage_wave(args.wave)
+
+
+async def _run_batch(bed: OkinBed, args: argparse.Namespace):
+    """Dispatch a batched write burst of named commands."""
+    if not args.commands:
+        raise ValueError("batch requires at least one command name")
+    try:
+        frames = [COMMAND_VIEWS[name.replace("-", "_")] for name in args.commands]
+    except KeyError as e:
+        raise ValueError(f"Unknown command in batch: {e.args[0]}")
+    await bed.send_batch(frames)
+
+
+# Command name -> awaitable factory; O(1) dispatch instead of walking an
+# if/elif chain of string compares per invocation
+DISPATCH = {
+    # Position control commands
+    "head-up": lambda bed, args: bed.head_up(),
+    "head-down": lambda bed, args: bed.head_down(),
+    "lumbar-up": lambda bed, args: bed.lumbar_up(),
+    "lumbar-down": lambda bed, args: bed.lumbar_down(),
+    "foot-up": lambda bed, args: bed.foot_up(),
+    "foot-down": lambda bed, args: bed.foot_down(),
+    "stop": lambda bed, args: bed.stop(),
+    # Preset positions
+    "flat": lambda bed, args: bed.flat(),
+    "zero-gravity": lambda bed, args: bed.zero_gravity(),
+    "lounge": lambda bed, args: bed.lounge(),
+    "anti-snore": lambda bed, args: bed.anti_snore(),
+    "ascent": lambda bed, args: bed.ascent(),
+    # Massage control
+    "massage-on": lambda bed, args: bed.massage_on(),
+    "massage-off": lambda bed, args: bed.massage_off(),
+    "massage-wave": _run_massage_wave,
+    # Lighting control
+    "light-on": lambda bed, args: bed.light_on(),
+    "light-off": lambda bed, args: bed.light_off(),
+    "light-toggle": lambda bed, args: bed.light_toggle(),
+    "brightness-up": lambda bed, args: bed.brightness_up(),
+    "brightness-down": lambda bed, args: bed.brightness_down(),
+    # Batched submission
+    "batch": _run_batch,
+}
+
 
 async def execute_command(
     bed: OkinBed,
@@ -32,65 +98,20 @@ async def execute_command(
     Returns:
         True if command executed successfully, False otherwise
     """
-    try:
-        # Position control commands
-        if command == "head-up":
-            await bed.head_up()
-        elif command == "head-down":
-            await bed.head_down()
-        elif command == "lumbar-up":
-            await bed.lumbar_up()
-        elif command == "lumbar-down":
-            await bed.lumbar_down()
-        elif command == "foot-up":
-            await bed.foot_up()
-        elif command == "foot-down":
-            await bed.foot_down()
-        elif command == "stop":
-            await bed.stop()
-
-        # Preset positions
-        elif command == "flat":
-            await bed.flat()
-        elif command == "zero-gravity":
-            await bed.zero_gravity()
-        elif command == "lounge":
-            await bed.lounge()
-        elif command == "anti-snore":
-            await bed.anti_snore()
-        elif command == "ascent":
-            await bed.ascent()
-
-        # Massage control
-        elif command == "massage-on":
-            await bed.massage_on()
-        elif command == "massage-off":
-            await bed.massage_off()
-        elif command == "massage-wave":
-            if not args.wave:
-                logger.error("Wave number required (1, 2, or 3)")
-                return False
-            await bed.set_massage_wave(args.wave)
-
-        # Lighting control
-        elif command == "light-on":
-            await bed.light_on()
-        elif command == "light-off":
-            await bed.light_off()
-        elif command == "light-toggle":
-            await bed.light_toggle()
-        elif command == "brightness-up":
-            await bed.brightness_up()
-        elif command == "brightness-down":
-            await bed.brightness_down()
-
-        else:
-            logger.error(f"Unknown command: {command}")
-            return False
+    handler = DISPATCH.get(command)
+    if handler is None:
+        logger.error(f"Unknown command: {command}")
+        return False
 
+    try:
+        await handler(bed, args)
         logger.info(f"Command '{command}' executed successfully")
         return True
 
+    except ValueError as e:
+        logger.error(str(e))
+        return False
+
     except Exception as e:
         logger.error(f"Error executing command: {e}")
         return False
@@ -138,8 +159,9 @@ async def async_main(args: argparse.Namespace) -> int:
         return 1
 
 
-def main():
-    """Main CLI entry point."""
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once; argparse setup isn't free."""
     parser = argparse.ArgumentParser(
         description="Control OKIN adjustable bed via Bluetooth LE",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -149,20 +171,20 @@ Examples:
   okin-bed zero-gravity
   okin-bed massage-wave 2
   okin-bed --mac XX:XX:XX:XX:XX:XX flat
+  okin-bed batch flat massage-on light-on
         """
     )
 
     parser.add_argument(
         "command",
         help="Command to execute",
-        choices=[
-            "head-up", "head-down", "lumbar-up", "lumbar-down",
-            "foot-up", "foot-down", "stop",
-            "flat", "zero-gravity", "lounge", "anti-snore", "ascent",
-            "massage-on", "massage-off", "massage-wave",
-            "light-on", "light-off", "light-toggle",
-            "brightness-up", "brightness-down"
-        ]
+        choices=CLI_COMMANDS
+    )
+
+    parser.add_argument(
+        "commands",
+        nargs="*",
+        help="Command names to send when using 'batch'"
     )
 
     parser.add_argument(
@@ -195,10 +217,53 @@ Examples:
         help="Enable verbose logging"
     )
 
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    parser = _build_parser()
     args = parser.parse_args()
 
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    # The trailing "commands" positional only applies to 'batch'; anywhere
+    # else the extra words would be silently ignored, which hides typos
+    # like "okin-bed flat massage-on". Validate batch members here too so
+    # bad names fail with a usage error before touching the radio.
+    # (argparse can't express this itself: choices= on a nargs="*"
+    # positional rejects the empty list on Python < 3.12.)
+    if args.command != "batch":
+        if args.commands:
+            parser.error(
+                f"unrecognized arguments: {' '.join(args.commands)} "
+                "(extra command names are only valid with 'batch')"
+            )
+    else:
+        unknown = [name for name in args.commands if name not in BATCH_COMMANDS]
+        if unknown:
+            parser.error(
+                f"invalid batch command(s): {', '.join(unknown)} "
+                f"(choose from {', '.join(BATCH_COMMANDS)})"
+            )
+
+    # Configure logging once, at the right level - no module-import cost
+    # and no reconfiguring a handler when --verbose is set
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    # Drop-in C event loop when available - shaves startup and per-await
+    # overhead off short-lived invocations (the server already runs uvloop
+    # via uvicorn)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        try:
+            import winloop
+            winloop.install()
+        except ImportError:
+            pass
 
     # Run async main
     exit_code = asyncio.run(async_main(args))
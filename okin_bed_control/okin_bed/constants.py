@@ -1,11 +1,17 @@
 """Constants for OKIN Bed BLE protocol."""
 
-from enum import Enum
+import re
+from enum import Enum, IntEnum
 
 # BLE Service UUIDs
 OKIN_SERVICE_UUID = "62741523-52F9-8864-B1AB-3B3A8D65950B"
 NUS_SERVICE_UUID = "6E400001-B5A3-F393-E0A9-E50E24DCCA9E"
 
+# Lowercased once at import for comparisons against backend-reported
+# UUIDs, which bleak normalizes to lowercase
+OKIN_SERVICE_UUID_LOWER = OKIN_SERVICE_UUID.lower()
+NUS_SERVICE_UUID_LOWER = NUS_SERVICE_UUID.lower()
+
 # BLE Characteristic UUIDs - OKIN Custom
 OKIN_TX_CHAR_UUID = "62741525-52F9-8864-B1AB-3B3A8D65950B"  # Write to bed
 OKIN_RX_CHAR_UUID = "62741625-52F9-8864-B1AB-3B3A8D65950B"  # Read from bed
@@ -26,6 +32,10 @@ ALT_CHAR_UUID_5 = "0000ffe5-0000-1000-8000-00805f9b34fb"
 # CCCD UUID (for enabling notifications)
 CCCD_UUID = "00002902-0000-1000-8000-00805f9b34fb"
 
+# Standard Generic Access Device Name characteristic (readable on most
+# peripherals; used as a benign keep-alive read)
+GAP_DEVICE_NAME_CHAR_UUID = "00002a00-0000-1000-8000-00805f9b34fb"
+
 # Device name patterns to look for
 DEVICE_NAME_PATTERNS = [
     "OKIN",
@@ -34,45 +44,114 @@ DEVICE_NAME_PATTERNS = [
     "Luxe",
 ]
 
-# Command bytes - captured and confirmed from BLE traffic
+# Lowercased once at import for case-insensitive matching in scan callbacks
+DEVICE_NAME_PATTERNS_LC = tuple(pattern.lower() for pattern in DEVICE_NAME_PATTERNS)
+
+# Compiled alternation of the patterns - one C-level scan per incoming
+# advertisement name instead of a Python loop of substring searches
+DEVICE_NAME_PATTERN_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in DEVICE_NAME_PATTERNS),
+    re.IGNORECASE,
+)
+
+# Every captured command shares the frame 5a 01 03 10 30 <op> a5 - only
+# the opcode byte differs, so store the opcodes and build the frames once
+# at import. A future checksum or sequence byte is a single edit to
+# build_frame().
+class Op(IntEnum):
+    """Opcode byte (frame position 5) - captured from BLE traffic."""
+    # Position control
+    HEAD_UP = 0x00
+    HEAD_DOWN = 0x01
+    FOOT_UP = 0x02
+    FOOT_DOWN = 0x03
+    LUMBAR_UP = 0x04
+    LUMBAR_DOWN = 0x07
+    STOP = 0x0F
+    # Presets
+    FLAT = 0x10
+    LOUNGE = 0x11  # TV mode
+    ZERO_GRAVITY = 0x13
+    ANTI_SNORE = 0x16
+    # Massage
+    MASSAGE_ON = 0x58
+    MASSAGE_WAVE_SLOW_PULSE = 0x59
+    MASSAGE_OFF = 0x5A
+    # Lighting
+    LIGHT_ON = 0x73
+    LIGHT_OFF = 0x74
+    # Unknown
+    UNKNOWN_6F = 0x6F  # Does nothing
+
+
+_FRAME_PREFIX = bytes([0x5a, 0x01, 0x03, 0x10, 0x30])
+_FRAME_SUFFIX = bytes([0xa5])
+
+
+def build_frame(op: int) -> bytes:
+    """Build the standard 7-byte command frame for an opcode."""
+    return b"".join((_FRAME_PREFIX, bytes((op,)), _FRAME_SUFFIX))
+
+
+# Command bytes - built from the opcode table; kept as plain bytes
+# attributes for back-compat with existing callers
 class Command:
     """Command byte constants - tested and verified."""
     # Position control
-    HEAD_UP = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x00, 0xa5])
-    HEAD_DOWN = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x01, 0xa5])
-    LUMBAR_UP = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x04, 0xa5])
-    LUMBAR_DOWN = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x07, 0xa5])
-    FOOT_UP = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x02, 0xa5])
-    FOOT_DOWN = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x03, 0xa5])
-    STOP = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x0f, 0xa5])
+    HEAD_UP = build_frame(Op.HEAD_UP)
+    HEAD_DOWN = build_frame(Op.HEAD_DOWN)
+    LUMBAR_UP = build_frame(Op.LUMBAR_UP)
+    LUMBAR_DOWN = build_frame(Op.LUMBAR_DOWN)
+    FOOT_UP = build_frame(Op.FOOT_UP)
+    FOOT_DOWN = build_frame(Op.FOOT_DOWN)
+    STOP = build_frame(Op.STOP)
 
     # Presets
-    FLAT = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x10, 0xa5])
-    ZERO_GRAVITY = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x13, 0xa5])
-    LOUNGE = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x11, 0xa5])  # TV mode
-    ANTI_SNORE = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x16, 0xa5])
+    FLAT = build_frame(Op.FLAT)
+    ZERO_GRAVITY = build_frame(Op.ZERO_GRAVITY)
+    LOUNGE = build_frame(Op.LOUNGE)  # TV mode
+    ANTI_SNORE = build_frame(Op.ANTI_SNORE)
     ASCENT = bytes([0x00])  # NOT YET CAPTURED
 
     # Massage
-    MASSAGE_ON = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x58, 0xa5])
-    MASSAGE_WAVE_SLOW_PULSE = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x59, 0xa5])
-    MASSAGE_OFF = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x5a, 0xa5])
+    MASSAGE_ON = build_frame(Op.MASSAGE_ON)
+    MASSAGE_WAVE_SLOW_PULSE = build_frame(Op.MASSAGE_WAVE_SLOW_PULSE)
+    MASSAGE_OFF = build_frame(Op.MASSAGE_OFF)
     MASSAGE_WAVE_1 = bytes([0x00])  # NOT YET CAPTURED
     MASSAGE_WAVE_2 = bytes([0x00])  # NOT YET CAPTURED
     MASSAGE_WAVE_3 = bytes([0x00])  # NOT YET CAPTURED
 
     # Lighting
-    LIGHT_ON = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x73, 0xa5])
-    LIGHT_OFF = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x74, 0xa5])
+    LIGHT_ON = build_frame(Op.LIGHT_ON)
+    LIGHT_OFF = build_frame(Op.LIGHT_OFF)
     LIGHT_TOGGLE = bytes([0x00])  # NOT YET CAPTURED
     BRIGHTNESS_UP = bytes([0x00])  # NOT YET CAPTURED
     BRIGHTNESS_DOWN = bytes([0x00])  # NOT YET CAPTURED
 
     # Unknown commands
-    UNKNOWN_6F = bytes([0x5a, 0x01, 0x03, 0x10, 0x30, 0x6f, 0xa5])  # Does nothing
+    UNKNOWN_6F = build_frame(Op.UNKNOWN_6F)  # Does nothing
     UNKNOWN_SPECIAL = bytes([0x5a, 0xb0, 0x00, 0xa5])  # Not tested
 
 
+# All command frames packed into one contiguous backing buffer, with
+# zero-copy memoryviews into it keyed by lowercase command name. bleak
+# accepts any bytes-like object, so hot paths can write a view without
+# allocating a fresh bytes object per call.
+_COMMAND_ITEMS = [
+    (name, value)
+    for name, value in vars(Command).items()
+    if not name.startswith("_") and isinstance(value, bytes)
+]
+_COMMAND_POOL = b"".join(value for _, value in _COMMAND_ITEMS)
+
+COMMAND_VIEWS = {}
+_offset = 0
+for _name, _value in _COMMAND_ITEMS:
+    COMMAND_VIEWS[_name.lower()] = memoryview(_COMMAND_POOL)[_offset:_offset + len(_value)]
+    _offset += len(_value)
+del _name, _value, _offset
+
+
 class BedPosition(Enum):
     """Preset bed positions."""
     FLAT = "flat"
@@ -95,7 +174,24 @@ class LightState(Enum):
     ON = 1
 
 
+# Preferred ATT MTU. The BLE default of 23 bytes (20 payload) forces
+# batched command frames to fragment; 247 fits a full burst in one PDU.
+TARGET_MTU = 247
+
 # Timeouts and delays
 CONNECTION_TIMEOUT = 30.0  # seconds
-COMMAND_DELAY = 0.1  # seconds between commands
+COMMAND_DELAY = 0.1  # minimum spacing between movement frames
+WRITE_TIMEOUT = 2.0  # seconds before a stuck GATT write is abandoned
+DEVICE_RESOLVE_TIMEOUT = 1.0  # seconds for the quick pre-connect device lookup
+DISCONNECT_TIMEOUT = 5.0  # seconds before a hanging disconnect is abandoned
 SCAN_TIMEOUT = 10.0  # seconds for device scanning
+
+# Target scan interval/window in 0.625 ms units (0x0010 = 10 ms at 100%
+# duty cycle). BlueZ's D-Bus discovery API does not take these directly;
+# they document the intended radio duty cycle for backends that do expose
+# them. On Linux the kernel defaults can be shortened at install time via
+# debugfs (same mechanism as the connection-interval tuning in the API
+# server), e.g.:
+#   echo 16 > /sys/kernel/debug/bluetooth/hci0/... (adapter-dependent)
+SCAN_INTERVAL = 0x0010
+SCAN_WINDOW = 0x0010
@@ -26,7 +26,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=[
-        "bleak>=0.20.0",
+        "bleak>=0.21.0",  # services= filter on BleakClient
         "python-dotenv>=0.19.0",
     ],
     extras_require={
@@ -40,6 +40,10 @@ setup(
             "fastapi>=0.104.0",
             "uvicorn[standard]>=0.24.0",
             "pydantic>=2.0.0",
+            "orjson>=3.9.0",
+            # uvicorn[standard] already pulls this in, but the server asks
+            # for loop="uvloop" explicitly, so depend on it explicitly too
+            'uvloop>=0.17.0; platform_system != "Windows"',
         ],
     },
     entry_points={